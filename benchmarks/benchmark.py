@@ -0,0 +1,349 @@
+"""
+Benchmarks the hot paths of the BenQ Projector integration against a simulated projector.
+
+Measures the config entry setup time with and without cached capabilities, the cost of one
+coordinator update fanned out to all entities and of an update of a single key, the duration of
+a full polling sweep, the latency of number writes from the minimum to the maximum value, and
+the latency of source switching.
+Every benchmark runs over a pseudo terminal paced at 2400, 9600 and 115200 baud and over TCP.
+
+Usage:
+    pip install -r benchmarks/requirements.txt
+    python benchmarks/benchmark.py --output results.json
+
+The results are written as JSON, one entry per link and benchmark with the statistics of the
+measured durations in seconds. Compare two result files with --compare to detect regressions,
+benchmarks/baseline.json holds the results of a reference run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+# pylint: disable=wrong-import-position
+from benqprojector_simulator import (  # noqa: E402
+    SimulatedProjector,
+    SimulatorOptions,
+    load_config,
+    serve_pty,
+    serve_tcp,
+)
+from homeassistant import loader  # noqa: E402
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TYPE  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+from homeassistant.helpers import frame  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.benqprojector.const import (  # noqa: E402
+    CONF_BAUD_RATE,
+    CONF_MODEL,
+    CONF_SERIAL_PORT,
+    CONF_TYPE_TELNET,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger("benchmark")
+
+# The links the benchmarks run over, the baud rate paces the simulated serial line.
+LINKS = {
+    "serial-2400": 2400,
+    "serial-9600": 9600,
+    "serial-115200": 115200,
+    "tcp": 0,
+}
+
+# The number entities whose writes are benchmarked, with their maximum value.
+NUMBER_KEYS = {"bri": 100, "roffset": 511}
+
+# The key of the single key update, a key only its own entity listens to.
+FAN_OUT_KEY = "bri"
+
+# Seconds to wait for the coordinator to connect and start polling.
+CONNECT_TIMEOUT = 30
+
+# A benchmark has regressed when its median increased by more than this fraction.
+REGRESSION_THRESHOLD = 0.2
+
+
+def summarize(samples: list[float]) -> dict[str, Any]:
+    """Return the statistics of the measured durations."""
+    samples = sorted(samples)
+    return {
+        "n": len(samples),
+        "mean": statistics.fmean(samples),
+        "median": statistics.median(samples),
+        "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        "min": samples[0],
+        "max": samples[-1],
+    }
+
+
+async def measure(
+    function: Callable[[], Awaitable[Any]], repeat: int
+) -> dict[str, Any]:
+    """Measure the duration of an awaitable function."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await function()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+async def start_simulator(
+    link: str, baud_rate: int, options: SimulatorOptions
+) -> dict[str, Any]:
+    """Start a simulated projector and return the config entry data to connect to it."""
+    options.baud_rate = baud_rate
+    projector = SimulatedProjector(options)
+
+    if link == "tcp":
+        server = await serve_tcp(projector, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        return {CONF_TYPE: CONF_TYPE_TELNET, CONF_HOST: "127.0.0.1", CONF_PORT: port}
+
+    serial_port = await serve_pty(projector)
+    return {
+        CONF_TYPE: "serial",
+        CONF_SERIAL_PORT: serial_port,
+        CONF_BAUD_RATE: baud_rate,
+    }
+
+
+def enable_entities(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Create the benchmarked entities up front, so entities disabled by default are enabled."""
+    registry = er.async_get(hass)
+    for key in NUMBER_KEYS:
+        registry.async_get_or_create(
+            "number", DOMAIN, f"{entry.entry_id}-{key}", config_entry=entry
+        )
+
+
+async def stop_polling(coordinator) -> None:
+    """
+    Wait for the coordinator to start polling and stop it again.
+
+    The benchmarks are measured without the polling and listening of the coordinator itself,
+    which would compete for the projector connection.
+    """
+    async with asyncio.timeout(CONNECT_TIMEOUT):
+        while not coordinator.polling:
+            await asyncio.sleep(0.01)
+    await coordinator.async_stop_polling()
+
+
+def entity_id(hass: HomeAssistant, platform_name: str, unique_id: str) -> str:
+    """Return the entity id of an entity of the integration."""
+    return er.async_get(hass).async_get_entity_id(platform_name, DOMAIN, unique_id)
+
+
+async def benchmark_link(
+    link: str, baud_rate: int, args: argparse.Namespace
+) -> dict[str, Any]:
+    """Run all benchmarks over one link."""
+    options = SimulatorOptions(
+        model=args.model,
+        config=load_config(args.model, None),
+        power="on",
+        warm_up=0,
+        absolute_values=not args.increments,
+    )
+    data = await start_simulator(link, baud_rate, options)
+    # The capabilities are cached per model, the config flow stores the model as the projector
+    # reports it
+    data[CONF_MODEL] = args.model.upper()
+    results: dict[str, Any] = {}
+
+    async with async_test_home_assistant() as hass:
+        # Load the integration from the custom_components directory of this repository
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        # Like the test fixtures do, the helper is needed to report deprecated usage
+        frame.async_setup(hass)
+
+        entry = MockConfigEntry(domain=DOMAIN, data=data, title=args.model)
+        entry.add_to_hass(hass)
+        enable_entities(hass, entry)
+
+        start = time.perf_counter()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        results["setup_probe"] = summarize([time.perf_counter() - start])
+
+        coordinator = entry.runtime_data
+        await stop_polling(coordinator)
+        await coordinator.async_save_capabilities()
+
+        # Set up again with the cached capabilities, setup does not wait for the connection
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        start = time.perf_counter()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        results["setup_cached"] = summarize([time.perf_counter() - start])
+        coordinator = entry.runtime_data
+        assert coordinator.capability_cache.get(data[CONF_MODEL]) is not None
+
+        # Setup connects in the background and then starts polling
+        await stop_polling(coordinator)
+
+        listeners = len(coordinator._listeners)  # pylint: disable=protected-access
+        results["fan_out"] = await measure(
+            _async_wrap(coordinator.async_update_listeners), args.repeat * 10
+        )
+        results["fan_out"]["listeners"] = listeners
+
+        # Most updates are of a single key, polled or pushed, and only reach the listeners of
+        # the key and the listeners of all keys
+        # pylint: disable-next=protected-access
+        key_listeners = len(coordinator._key_listeners.get(FAN_OUT_KEY, {})) + len(
+            coordinator._global_listeners  # pylint: disable=protected-access
+        )
+        results["fan_out_key"] = await measure(
+            _async_wrap(lambda: coordinator.async_update_key_listeners(FAN_OUT_KEY)),
+            args.repeat * 10,
+        )
+        results["fan_out_key"]["listeners"] = key_listeners
+
+        async def full_sweep() -> None:
+            coordinator.polling_planner.reset()
+            await coordinator.async_poll_sweep()
+
+        results["poll_sweep"] = await measure(full_sweep, args.repeat)
+
+        for key, maximum in NUMBER_KEYS.items():
+            number_entity_id = entity_id(hass, "number", f"{entry.entry_id}-{key}")
+            if number_entity_id is None or hass.states.get(number_entity_id) is None:
+                continue
+
+            async def set_value(value: float, number_entity_id=number_entity_id):
+                await hass.services.async_call(
+                    "number",
+                    "set_value",
+                    {"entity_id": number_entity_id, "value": value},
+                    blocking=True,
+                )
+
+            samples = []
+            for _ in range(args.repeat):
+                await set_value(0)
+                start = time.perf_counter()
+                await set_value(maximum)
+                samples.append(time.perf_counter() - start)
+            results[f"number_write_{key}"] = summarize(samples)
+
+        media_player_entity_id = entity_id(
+            hass, "media_player", f"{entry.entry_id}-projector"
+        )
+        state = hass.states.get(media_player_entity_id)
+        sources = state.attributes.get("source_list", []) if state else []
+        if len(sources) >= 2:
+            samples = []
+            for i in range(args.repeat):
+                start = time.perf_counter()
+                await hass.services.async_call(
+                    "media_player",
+                    "select_source",
+                    {"entity_id": media_player_entity_id, "source": sources[i % 2]},
+                    blocking=True,
+                )
+                samples.append(time.perf_counter() - start)
+            results["source_switch"] = summarize(samples)
+
+        results["link_statistics"] = coordinator.link_statistics.as_dict()
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return results
+
+
+def _async_wrap(function: Callable[[], Any]) -> Callable[[], Awaitable[None]]:
+    async def wrapper() -> None:
+        function()
+
+    return wrapper
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Return the benchmarks whose median regressed compared to the baseline."""
+    regressions = []
+    for link, benchmarks in current["links"].items():
+        for name, result in benchmarks.items():
+            try:
+                before = baseline["links"][link][name]["median"]
+                after = result["median"]
+            except (KeyError, TypeError):
+                continue
+            if before and (after - before) / before > REGRESSION_THRESHOLD:
+                regressions.append(
+                    f"{link} {name}: median {before:.6f}s -> {after:.6f}s"
+                )
+    return regressions
+
+
+async def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--model", default="w1110", help="the model to simulate")
+    parser.add_argument(
+        "--link", action="append", choices=LINKS, help="the links to benchmark"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--increments",
+        action="store_true",
+        help="simulate a projector that only accepts increments for numeric keys",
+    )
+    parser.add_argument("--output", help="the file to write the results to")
+    parser.add_argument("--compare", help="a results file to compare the results to")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    results = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "model": args.model,
+        "increments": args.increments,
+        "repeat": args.repeat,
+        "links": {},
+    }
+    for link in args.link or LINKS:
+        _LOGGER.warning("Benchmarking %s", link)
+        results["links"][link] = await benchmark_link(link, LINKS[link], args)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    else:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if regressions := compare(baseline, results):
+            print("\n".join(regressions), file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,41 +1,66 @@
 """The BenQ Projector integration."""
 
+import asyncio
+import contextlib
 import logging
-from collections.abc import Callable
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from functools import partial
 from typing import Any
 
 import homeassistant.helpers.config_validation as cv
-import voluptuous as vol
-from benqprojector import BenQProjector, BenQProjectorSerial, BenQProjectorTelnet
+from benqprojector import BenQProjector, BenQProjectorSerial
+from benqprojector.benqclasses import (
+    BenQCommand,
+    BenQIllegalFormatError,
+    BenQProjectorError,
+    BenQUnsupportedItemError,
+)
+from benqprojector.benqconnection import BenQConnectionError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    CONF_DEVICE_ID,
     CONF_HOST,
     CONF_PORT,
     CONF_TYPE,
     Platform,
 )
-from homeassistant.core import (
-    CALLBACK_TYPE,
-    HomeAssistant,
-    ServiceCall,
-    SupportsResponse,
-    callback,
-)
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .cache import BenQProjectorCapabilityCache
+from .command_queue import (
+    PRIORITY_IDLE,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_POLL,
+    PRIORITY_SERVICE,
+    BenQProjectorCommandQueue,
+)
+from .connection import BenQProjectorNetwork
 from .const import (
     CONF_BAUD_RATE,
     CONF_DEFAULT_INTERVAL,
+    CONF_HAS_PROMPT,
     CONF_INTERVAL,
     CONF_MODEL,
     CONF_SERIAL_PORT,
     CONF_TYPE_TELNET,
     DOMAIN,
 )
+from .descriptions import (
+    NUMBER_ENTITY_DESCRIPTIONS,
+    SELECT_ENTITY_DESCRIPTIONS,
+    SWITCH_ENTITY_DESCRIPTIONS,
+)
+from .link_statistics import BenQProjectorLinkStatistics
+from .polling import POLL_CLASS_FAST, BenQProjectorPollingPlanner
+from .push import parse_push_frames
+from .services import async_setup_services
+from .snapshot import BenQProjectorSnapshots
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,23 +72,82 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
-CONF_SERVICE_COMMAND = "command"
-CONF_SERVICE_ACTION = "action"
+# Keys that are handled by the media player entity.
+MEDIA_PLAYER_KEYS = ("pow", "vol", "mute", "sour")
+# Keys that keep their value while the projector is powered off.
+POWER_OFF_KEYS = ("pow", "pp", "ltim", "ltim2")
 
-SERVICE_SEND_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_DEVICE_ID): cv.string,
-        vol.Required(CONF_SERVICE_COMMAND): cv.string,
-        vol.Optional(CONF_SERVICE_ACTION): cv.string,
-    }
-)
-SERVICE_SEND_RAW_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_DEVICE_ID): cv.string,
-        vol.Required(CONF_SERVICE_COMMAND): cv.string,
-    }
+# Keys of the platforms that only create entities for the keys the projector supports, these
+# platforms are not set up when none of their keys are supported.
+PLATFORM_KEYS: dict[Platform, tuple[str, ...]] = {
+    platform: tuple(entity_description.key for entity_description in descriptions)
+    for platform, descriptions in (
+        (Platform.NUMBER, NUMBER_ENTITY_DESCRIPTIONS),
+        (Platform.SELECT, SELECT_ENTITY_DESCRIPTIONS),
+        (Platform.SWITCH, SWITCH_ENTITY_DESCRIPTIONS),
+    )
+}
+
+# Option lists that are part of the capabilities of a projector.
+CAPABILITY_OPTION_LISTS = (
+    "video_sources",
+    "audio_sources",
+    "picture_modes",
+    "color_temperatures",
+    "aspect_ratios",
+    "projector_positions",
+    "lamp_modes",
+    "threed_modes",
+    "menu_positions",
 )
 
+# Minimum and maximum number of seconds between attempts to connect to the projector in the
+# background.
+CONNECT_RETRY_MIN_INTERVAL = 5
+CONNECT_RETRY_MAX_INTERVAL = 60
+
+# Number of consecutive failed power state polls after which the link is considered dead.
+LINK_FAILURE_THRESHOLD = 3
+
+# Number of seconds between polls of the power state while the projector is off.
+POWER_OFF_INTERVAL = 30
+
+# Keys that change other settings when set, these are applied before any other setting.
+LEADING_SETTING_KEYS = ("appmod", "ct")
+
+# Keys that can be set by applying settings, the keys of the number, select and switch entities.
+NUMBER_SETTING_KEYS = frozenset(PLATFORM_KEYS[Platform.NUMBER])
+SELECT_SETTING_KEYS = frozenset(PLATFORM_KEYS[Platform.SELECT])
+SWITCH_SETTING_KEYS = frozenset(PLATFORM_KEYS[Platform.SWITCH])
+
+# Number of increments that are send back to back when stepping a value.
+STEP_BURST_SIZE = 10
+
+# Number of bytes read at a time while listening for unsolicited messages, and the number of
+# seconds to wait before listening again when nothing was received.
+PUSH_READ_SIZE = 256
+PUSH_LISTEN_DELAY = 0.1
+
+
+def _connect_retry_intervals() -> Iterator[float]:
+    """
+    Yield the number of seconds to wait before every next attempt to connect.
+
+    The interval doubles with every attempt up to a maximum, half of every interval is random
+    so multiple projectors behind the same bridge do not reconnect in lockstep.
+    """
+    interval = CONNECT_RETRY_MIN_INTERVAL
+    while True:
+        yield interval / 2 + random.uniform(0, interval / 2)
+        interval = min(interval * 2, CONNECT_RETRY_MAX_INTERVAL)
+
+
+def _is_state_response(action: str | None, response: str | None) -> bool:
+    """Return True if the response to the action is the new state of the key."""
+    return response is not None and (
+        action == "?" or (action not in ["+", "-"] and response == action)
+    )
+
 
 class BenQProjectorCoordinator(DataUpdateCoordinator):
     """BenQ Projector Data Update Coordinator."""
@@ -72,8 +156,20 @@ class BenQProjectorCoordinator(DataUpdateCoordinator):
     model = None
     device_info: DeviceInfo = None
 
-    def __init__(self, hass: HomeAssistant | None, projector: BenQProjector) -> None:
-        """Initialize BenQ Projector Data Update Coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant | None,
+        projector: BenQProjector,
+        capabilities: dict[str, Any] | None = None,
+        capability_cache: BenQProjectorCapabilityCache | None = None,
+        snapshots: BenQProjectorSnapshots | None = None,
+    ) -> None:
+        """
+        Initialize BenQ Projector Data Update Coordinator.
+
+        If no capabilities are given the projector needs to be connected, otherwise the given
+        capabilities are used until they are revalidated once the projector is connected.
+        """
         super().__init__(
             hass,
             _LOGGER,
@@ -82,9 +178,77 @@ class BenQProjectorCoordinator(DataUpdateCoordinator):
         )
 
         self.projector = projector
-        self.projector.add_listener(self._listener)
+        self.snapshots = snapshots
+        # The platforms that are set up for the projector
+        self.platforms: list[Platform] = list(PLATFORMS)
+
+        # Performance counters of the projector link
+        self.link_statistics = BenQProjectorLinkStatistics()
+        self.link_statistics.instrument(projector.connection)
+
+        # All use of the projector connection goes through the command queue, this way
+        # interactive commands are executed before pending polling commands.
+        self.command_queue = BenQProjectorCommandQueue(
+            partial(
+                hass.async_create_background_task,
+                name=f"{DOMAIN} {projector.unique_id} command queue",
+            )
+        )
+        self._poll_task: asyncio.Task | None = None
+        # Number of consecutive failed power state polls
+        self._link_failures = 0
+        # Set when the power state changes, to wake up polling
+        self._power_changed = asyncio.Event()
+
+        # Decides which keys are due to be polled.
+        self.polling_planner = BenQProjectorPollingPlanner(CONF_DEFAULT_INTERVAL)
+        for key in MEDIA_PLAYER_KEYS:
+            self.polling_planner.set_poll_class(key, POLL_CLASS_FAST)
 
-        self.unique_id = self.projector.unique_id
+        # Listeners indexed by the projector key they are interested in, listeners without a key
+        # receive every update.
+        self._key_listeners: dict[str, dict[CALLBACK_TYPE, CALLBACK_TYPE]] = {}
+        self._global_listeners: dict[CALLBACK_TYPE, CALLBACK_TYPE] = {}
+
+        # Merged state of all keys reported by the projector, with a version and timestamp per
+        # key and the keys that changed with the last update.
+        self.data: dict[str, Any] = {}
+        self._key_versions: dict[str, int] = {}
+        self._key_timestamps: dict[str, float] = {}
+        self.changed_keys: set[str] = set()
+
+        # The capabilities of the projector, either read from the connected projector or from
+        # the capability cache.
+        self.capability_cache = capability_cache
+        self._supported_commands: dict[str, bool] = {}
+        if capabilities is None:
+            self._initialized = True
+            capabilities = self._read_capabilities()
+        else:
+            # Entities are unavailable until the projector is connected
+            self._initialized = False
+            self.last_update_success = False
+        self._capabilities = {
+            name: value
+            for name, value in capabilities.items()
+            if name not in ["commands", "absolute_value_support"]
+        }
+        self._supported_commands = dict(capabilities.get("commands", {}))
+        # Whether a key accepts absolute values or can only be changed using increments.
+        self.absolute_value_support: dict[str, bool] = dict(
+            capabilities.get("absolute_value_support", {})
+        )
+
+        self.async_update_keys(
+            {
+                "pow": self.projector.power_status,
+                "vol": self.projector.volume,
+                "mute": self.projector.muted,
+                "sour": self.projector.video_source,
+            }
+        )
+
+        self.unique_id = self._capabilities.get("unique_id", self.projector.unique_id)
         model = self.projector.model
         if model is not None:
             self.model = model
@@ -98,52 +262,410 @@ class BenQProjectorCoordinator(DataUpdateCoordinator):
 
     @property
     def power_status(self):
-        return self.projector.power_status
+        return self.data.get("pow", BenQProjector.POWERSTATUS_UNKNOWN)
 
     @property
     def volume(self):
-        return self.projector.volume
+        return self.data.get("vol")
 
     @property
     def muted(self):
-        return self.projector.muted
+        return self.data.get("mute")
 
     @property
     def video_source(self):
-        return self.projector.video_source
+        return self.data.get("sour")
 
     @property
     def video_sources(self):
-        return self.projector.video_sources
+        return self.option_list("video_sources")
+
+    def option_list(self, name: str) -> list[str] | None:
+        """Return one of the option lists of the projector, like the video sources."""
+        return self._capabilities.get(name)
+
+    @property
+    def capabilities(self) -> dict[str, Any]:
+        """The capabilities of the projector, as stored in the capability cache."""
+        return {
+            **self._capabilities,
+            "commands": dict(self._supported_commands),
+            "absolute_value_support": dict(self.absolute_value_support),
+        }
+
+    def _read_capabilities(self) -> dict[str, Any]:
+        """Read the capabilities from the connected projector."""
+        capabilities = {
+            name: getattr(self.projector, name) for name in CAPABILITY_OPTION_LISTS
+        }
+        capabilities["unique_id"] = self.projector.unique_id
+        capabilities["commands"] = {
+            command: self.projector.supports_command(command)
+            for command in self._supported_commands
+        }
+        return capabilities
+
+    def supported_platforms(self) -> list[Platform]:
+        """
+        Return the platforms that have entities for the keys the projector supports.
+
+        Every key of every platform is checked, not only until a supported key is found, so the
+        capabilities that are cached include all keys.
+        """
+        supported = {
+            key: self.supports_command(key)
+            for keys in PLATFORM_KEYS.values()
+            for key in keys
+        }
+        return [
+            platform
+            for platform in PLATFORMS
+            if platform not in PLATFORM_KEYS
+            or any(supported[key] for key in PLATFORM_KEYS[platform])
+        ]
+
+    async def async_revalidate_capabilities(self) -> bool:
+        """
+        Compare the cached capabilities with the capabilities of the connected projector.
+
+        The capabilities are updated and saved to the capability cache. Returns False if the
+        capabilities changed, in that case the entities no longer match the projector.
+        """
+        self._initialized = True
+
+        capabilities = self._read_capabilities()
+        valid = capabilities == {
+            **self._capabilities,
+            "commands": self._supported_commands,
+        }
+
+        self._supported_commands = capabilities.pop("commands")
+        self._capabilities = capabilities
+        await self.async_save_capabilities()
+
+        return valid
+
+    async def async_save_capabilities(self) -> None:
+        """Save the capabilities to the capability cache."""
+        if self.capability_cache is not None:
+            await self.capability_cache.async_save(self.model, self.capabilities)
 
     @callback
-    def _listener(self, command: str, data):
-        self.async_set_updated_data({command: data})
-
-    # async def async_connect(self):
-    #     try:
-    #         if not await self.projector.connect():
-    #             raise ConfigEntryNotReady(
-    #                 f"Unable to connect to BenQ projector on {self.projector.connection}"
-    #             )
-    #     except TimeoutError as ex:
-    #         raise ConfigEntryNotReady(
-    #             f"Unable to connect to BenQ projector on {self.projector.connection}", ex
-    #         )
-    #
-    #     _LOGGER.debug("Connected to BenQ projector on %s", self.projector.connection)
-    #
-    #     self.unique_id = self.projector.unique_id
-    #     model = self.projector.model
-    #
-    #     self.device_info = DeviceInfo(
-    #         identifiers={(DOMAIN, self.unique_id)},
-    #         name=f"BenQ {model}",
-    #         model=model,
-    #         manufacturer="BenQ",
-    #     )
+    def async_update_keys(self, data: dict[str, Any]) -> set[str]:
+        """
+        Merge the given key values into the coordinator state.
+
+        Only the listeners of the keys that actually changed are updated. When the projector is
+        no longer powered on the keys that are only valid while powered on are dropped.
+        """
+        now = time.monotonic()
+        changed_keys = set()
+        for key, value in data.items():
+            if value is None:
+                continue
+
+            self._key_timestamps[key] = now
+            if key in self.data and self.data[key] == value:
+                continue
+
+            self.data[key] = value
+            self._key_versions[key] = self._key_versions.get(key, 0) + 1
+            changed_keys.add(key)
+
+        if "pow" in changed_keys and self.data["pow"] not in [
+            BenQProjector.POWERSTATUS_POWERINGON,
+            BenQProjector.POWERSTATUS_ON,
+        ]:
+            for key in [key for key in self.data if key not in POWER_OFF_KEYS]:
+                del self.data[key]
+                del self._key_timestamps[key]
+
+        if "pow" in changed_keys:
+            self._power_changed.set()
+            if self.data["pow"] == BenQProjector.POWERSTATUS_ON:
+                # Refresh all keys now the projector is powered on
+                self.polling_planner.reset()
+
+        self.changed_keys = changed_keys
+
+        if "pow" in changed_keys:
+            # A change of the power state affects the availability of every entity and is thus
+            # forwarded to all listeners.
+            self.async_update_listeners()
+        elif changed_keys:
+            self.async_update_key_listeners(*changed_keys)
+
+        return changed_keys
+
+    @callback
+    def async_update_key_listeners(self, *commands: str) -> None:
+        """
+        Update only the listeners that are interested in the given keys.
+
+        Every listener is updated once, also when it is interested in several of the keys.
+        """
+        update_callbacks = dict(self._global_listeners)
+        for command in commands:
+            update_callbacks.update(self._key_listeners.get(command, {}))
+
+        for update_callback in list(update_callbacks.values()):
+            update_callback()
+
+    def key_version(self, command: str) -> int:
+        """Return how many times the value of the given key has changed."""
+        return self._key_versions.get(command, 0)
+
+    def key_age(self, command: str) -> float | None:
+        """Return the number of seconds since the given key was last reported."""
+        if (timestamp := self._key_timestamps.get(command)) is None:
+            return None
+        return time.monotonic() - timestamp
+
+    async def async_connect(self) -> None:
+        """
+        Connect to the projector, retrying until the connection is established.
+
+        The time between attempts grows exponentially with random jitter, up to a maximum.
+        """
+        retry_intervals = _connect_retry_intervals()
+        while not await self.command_queue.async_submit(
+            self.projector.connect, PRIORITY_POLL
+        ):
+            retry_interval = next(retry_intervals)
+            _LOGGER.debug(
+                "Unable to connect to device %s, retrying in %.1f seconds",
+                self.unique_id,
+                retry_interval,
+            )
+            await asyncio.sleep(retry_interval)
+            self.link_statistics.record_retry()
+
+        self._link_failures = 0
+        _LOGGER.info("Device %s is available", self.unique_id)
+
+    @property
+    def link_alive(self) -> bool:
+        """False if the connection is closed or the projector stopped responding."""
+        return (
+            self.projector.connected() and self._link_failures < LINK_FAILURE_THRESHOLD
+        )
+
+    async def _async_reconnect(self) -> None:
+        """
+        Reconnect to the projector after the link died.
+
+        The entities become unavailable until the projector responds again. The listeners and
+        polling state are kept, all keys are due to be polled right after reconnecting so the
+        entities are resynchronized in a single sweep.
+        """
+        _LOGGER.warning("Lost connection to device %s, reconnecting", self.unique_id)
+
+        self.last_update_success = False
+        self.async_update_listeners()
+
+        await self.projector.connection.close()
+        await self.async_connect()
+
+        self.polling_planner.reset()
+
+    @callback
+    def async_start_polling(self, interval: float) -> None:
+        """Start polling the projector for the keys entities are listening to."""
+        self.polling_planner.interval = interval
+        if self._poll_task is None:
+            self._poll_task = self.hass.async_create_background_task(
+                self._async_poll(interval), f"{DOMAIN} {self.unique_id} polling"
+            )
+
+    @property
+    def polling(self) -> bool:
+        """True if the projector is being polled."""
+        return self._poll_task is not None
+
+    async def async_stop_polling(self) -> None:
+        """Stop polling the projector and listening for unsolicited messages."""
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poll_task
+            self._poll_task = None
+
+    async def _async_poll(self, interval: float) -> None:
+        """
+        Poll the projector every interval.
+
+        While the projector is off only the power state is polled, at a slower pace. A change of
+        the power state, for instance by turning on the projector from Home Assistant, resumes
+        polling every interval right away.
+        """
+        while True:
+            start = time.monotonic()
+            try:
+                await self.async_poll_sweep()
+                self.link_statistics.record_sweep(time.monotonic() - start)
+            except (BrokenPipeError, ConnectionResetError, BenQConnectionError):
+                _LOGGER.error("Error communicating with BenQ projector")
+                await self.projector.connection.close()
+            # pylint: disable=broad-exception-caught
+            except Exception:
+                _LOGGER.exception("Unexpected error while polling BenQ projector")
+
+            if not self.link_alive:
+                await self._async_reconnect()
+                # Resynchronize right away
+                continue
+
+            timeout = interval
+            if self.power_status == BenQProjector.POWERSTATUS_OFF:
+                timeout = max(interval, POWER_OFF_INTERVAL)
+
+            self._power_changed.clear()
+            try:
+                async with asyncio.timeout(timeout):
+                    await self._async_listen()
+            except TimeoutError:
+                pass
+            except (OSError, BenQConnectionError):
+                _LOGGER.error("Error communicating with BenQ projector")
+                await self.projector.connection.close()
+            # pylint: disable=broad-exception-caught
+            except Exception:
+                _LOGGER.exception("Unexpected error while listening to BenQ projector")
+
+            if not self.link_alive:
+                await self._async_reconnect()
+
+    async def _async_read_push(self) -> bytes:
+        return await self.projector.connection.read(PUSH_READ_SIZE)
+
+    async def _async_listen(self) -> None:
+        """
+        Listen for unsolicited status messages until the power state changes.
+
+        Some models and serial to network bridges send status lines like *pow=on# when the
+        projector is operated with the remote control or its keypad. Listening is an idle job
+        of the command queue, any command preempts it.
+        """
+        buffer = b""
+        while not self._power_changed.is_set():
+            if not self.projector.connected():
+                await self._power_changed.wait()
+                return
+
+            data = await self.command_queue.async_submit(
+                self._async_read_push, PRIORITY_IDLE
+            )
+            if not data:
+                # Preempted by a command, or nothing was received
+                await asyncio.sleep(PUSH_LISTEN_DELAY)
+                continue
+
+            buffer += data
+            if (end := buffer.rfind(b"#")) >= 0:
+                self.async_handle_push(buffer[: end + 1])
+                buffer = buffer[end + 1 :]
+            # Keep the start of an incomplete status line only
+            buffer = buffer[-PUSH_READ_SIZE:]
+
+    @callback
+    def async_handle_push(self, data: bytes) -> None:
+        """
+        Apply the unsolicited status lines in the data to the coordinator state.
+
+        The keys are confirmed as if they were polled, so they are not read again by the next
+        polling sweep. Only keys that are already known or that entities listen to are applied,
+        other keys in the data are not added to the capabilities of the projector.
+        """
+        values = {
+            key: value
+            for key, value in parse_push_frames(data).items()
+            if key in self.data or self._key_listeners.get(key)
+        }
+        if not values:
+            return
+
+        power_status = values.get("pow", self.power_status)
+        if power_status != BenQProjector.POWERSTATUS_ON:
+            # Only a few keys are valid while the projector is not powered on
+            values = {
+                key: value for key, value in values.items() if key in POWER_OFF_KEYS
+            }
+
+        _LOGGER.debug("Received %s from device %s", values, self.unique_id)
+        self.link_statistics.record_push(len(values))
+
+        changed_keys = self.async_update_keys(values)
+        for key in values:
+            if key != "pow":
+                self.polling_planner.record_poll(key, key in changed_keys)
+
+    async def _async_poll_job(self, job: Callable[[], Awaitable[Any]]) -> Any:
+        return await self.command_queue.async_submit(job, PRIORITY_POLL)
+
+    def _is_poll_due(self, key: str) -> bool:
+        return key not in self.data or self.polling_planner.is_due(key)
+
+    async def async_poll_sweep(self) -> None:
+        """
+        Read the current state of the projector for the keys that are due to be polled.
+
+        Every key is read as a separate polling job, interactive commands that are submitted
+        during the sweep are executed before the remaining keys are read. The power state is
+        read every sweep, the polling planner decides which other keys are due.
+        """
+        if not await self._async_poll_job(self.projector.update_power):
+            self._link_failures += 1
+            self.async_update_keys({"pow": self.projector.power_status})
+            return
+
+        self._link_failures = 0
+        if not self.last_update_success:
+            self.last_update_success = True
+            # The link recovered, update the availability of all entities
+            self.async_update_listeners()
+        self.async_update_keys({"pow": self.projector.power_status})
+
+        keys = [key for key, listeners in self._key_listeners.items() if listeners]
+
+        if self.power_status == BenQProjector.POWERSTATUS_ON:
+            volume_keys = [
+                key for key in ["vol", "mute"] if key in keys and self._is_poll_due(key)
+            ]
+            if volume_keys:
+                await self._async_poll_job(self.projector.update_volume)
+                changed_keys = self.async_update_keys(
+                    {"vol": self.projector.volume, "mute": self.projector.muted}
+                )
+                for key in volume_keys:
+                    self.polling_planner.record_poll(key, key in changed_keys)
+
+            if "sour" in keys and self._is_poll_due("sour"):
+                await self._async_poll_job(self.projector.update_video_source)
+                changed_keys = self.async_update_keys(
+                    {"sour": self.projector.video_source}
+                )
+                self.polling_planner.record_poll("sour", "sour" in changed_keys)
+
+            for key in keys:
+                if key not in MEDIA_PLAYER_KEYS and self._is_poll_due(key):
+                    response = await self._async_poll_job(
+                        partial(self.projector.send_command, key)
+                    )
+                    changed_keys = self.async_update_keys({key: response})
+                    self.polling_planner.record_poll(key, key in changed_keys)
+        else:
+            # Only a few keys can be read while the projector is off and they don't change
+            for key in keys:
+                if key in POWER_OFF_KEYS and key not in self.data:
+                    response = await self._async_poll_job(
+                        partial(self.projector.send_command, key)
+                    )
+                    self.async_update_keys({key: response})
 
     async def async_disconnect(self):
+        await self.async_stop_polling()
+        await self.command_queue.async_stop()
+
         await self.projector.disconnect()
         _LOGGER.debug(
             "Disconnected from BenQ projector on %s", self.projector.connection
@@ -153,44 +675,503 @@ class BenQProjectorCoordinator(DataUpdateCoordinator):
     def async_add_listener(
         self, update_callback: CALLBACK_TYPE, context: Any = None
     ) -> Callable[[], None]:
-        self.projector.add_listener(command=context)
+        """
+        Listen for data updates.
+
+        The context is either a single projector key, a tuple of projector keys or None to
+        receive the updates for all keys.
+        """
+        if context is None:
+            keys = ()
+        elif isinstance(context, str):
+            keys = (context,)
+        else:
+            keys = tuple(context)
+
+        remove_listener = super().async_add_listener(update_callback, context)
+
+        if keys:
+            for key in keys:
+                self._key_listeners.setdefault(key, {})[
+                    remove_listener
+                ] = update_callback
+        else:
+            self._global_listeners[remove_listener] = update_callback
+
+        @callback
+        def remove_key_listener() -> None:
+            for key in keys:
+                self._key_listeners[key].pop(remove_listener, None)
+            self._global_listeners.pop(remove_listener, None)
+            remove_listener()
 
-        return super().async_add_listener(update_callback, context)
+        return remove_key_listener
+
+    async def _async_submit(
+        self,
+        job: Callable[[], Awaitable[Any]],
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> Any:
+        if priority == PRIORITY_INTERACTIVE:
+            # The user is interacting with the projector, poll more often for a while
+            self.polling_planner.boost()
+        return await self.command_queue.async_submit(job, priority)
 
     def supports_command(self, command: str):
-        return self.projector.supports_command(command)
+        if (supported := self._supported_commands.get(command)) is not None:
+            return supported
+
+        supported = self.projector.supports_command(command)
+        if self._initialized:
+            self._supported_commands[command] = supported
+        return supported
+
+    async def async_send_command(
+        self,
+        command: str,
+        action: str | None = "?",
+        check_supported: bool = True,
+        priority: int = PRIORITY_INTERACTIVE,
+    ):
+        response = await self._async_submit(
+            partial(self.projector.send_command, command, action, check_supported),
+            priority,
+        )
+
+        if _is_state_response(action, response):
+            self.async_update_keys({command: response})
+
+        return response
+
+    async def async_send_batch(
+        self,
+        commands: list[tuple[str, str | None]],
+        stop_on_error: bool = False,
+        priority: int = PRIORITY_SERVICE,
+    ) -> list[str | None]:
+        """
+        Send a list of command and action pairs in a single submission.
+
+        The commands are send back to back without other jobs using the connection in between,
+        the key store is updated once after all commands have been send. Returns the responses
+        of the commands that have been send. If stop_on_error is True sending stops at the first
+        command without a response.
+        """
+
+        async def send_batch() -> list[str | None]:
+            responses = []
+            for command, action in commands:
+                response = await self.projector.send_command(command, action, False)
+                responses.append(response)
+                if response is None and stop_on_error:
+                    break
+            return responses
+
+        responses = await self._async_submit(send_batch, priority)
+
+        self.async_update_keys(
+            {
+                command: response
+                for (command, action), response in zip(commands, responses)
+                if _is_state_response(action, response)
+            }
+        )
+
+        return responses
+
+    async def async_read_keys(
+        self,
+        commands: list[str],
+        max_age: float | None = None,
+        priority: int = PRIORITY_SERVICE,
+    ) -> dict[str, Any]:
+        """
+        Return the values of the given keys.
+
+        Keys that have been reported within max_age seconds, by default the polling interval,
+        are taken from the coordinator state. The other keys are read in one batch. Keys the
+        projector does not report a value for are left out.
+        """
+        if max_age is None:
+            max_age = self.polling_planner.interval
+
+        values = {}
+        stale = []
+        for command in commands:
+            age = self.key_age(command)
+            if command in self.data and age is not None and age <= max_age:
+                values[command] = self.data[command]
+            else:
+                stale.append(command)
+
+        if stale:
+            responses = await self.async_send_batch(
+                [(command, "?") for command in stale], False, priority
+            )
+            for command, response in zip(stale, responses):
+                if response is not None:
+                    values[command] = response
+
+        return values
 
-    async def async_send_command(self, command: str, action: str | None = None):
-        if action:
-            return await self.projector.send_command(command, action)
-        return await self.projector.send_command(command)
+    async def async_set_value(self, command: str, value: float) -> bool | None:
+        """
+        Set a numeric key to an absolute value.
 
-    async def async_send_raw_command(self, command: str):
-        return await self.projector.send_raw_command(command)
+        Not all projector models accept absolute values, once the projector rejected an absolute
+        value for the key this is remembered and False is returned for any next attempt. Returns
+        None if it is not known whether the value was applied, the current value then needs to be
+        read before stepping.
+        """
+        if self.absolute_value_support.get(command) is False:
+            return False
+
+        action = str(int(value))
+        accepted = await self._async_submit(
+            partial(self._async_send_absolute_value, command, action)
+        )
+        if accepted:
+            self.async_update_keys({command: action})
+        if accepted is not None:
+            self._async_record_absolute_value_support(command, accepted)
+
+        return accepted
+
+    async def _async_send_absolute_value(
+        self, command: str, action: str, check_supported: bool = True
+    ) -> bool | None:
+        """
+        Send an absolute value for a numeric key.
+
+        Returns True if the value was accepted and False if the projector answered that the key
+        does not take absolute values. Returns None if this is not known, for instance because
+        the projector did not respond.
+        """
+        try:
+            # pylint: disable=protected-access
+            response = await self.projector._send_command(
+                BenQCommand(command, action), check_supported
+            )
+        except (BenQIllegalFormatError, BenQUnsupportedItemError):
+            return False
+        except BenQProjectorError:
+            return None
+        except BenQConnectionError:
+            await self.projector.connection.close()
+            return None
+
+        return True if response == action else None
+
+    @callback
+    def _async_record_absolute_value_support(
+        self, command: str, accepted: bool
+    ) -> None:
+        """Remember if a numeric key accepted an absolute value the first time it was set."""
+        if command in self.absolute_value_support:
+            return
+
+        if not accepted:
+            _LOGGER.debug(
+                "%s does not accept absolute values, using increments", command
+            )
+        self.absolute_value_support[command] = accepted
+        if self.capability_cache is not None:
+            self.capability_cache.async_delay_save(self.model, self.capabilities)
+
+    @staticmethod
+    def _setting_value(command: str, value: str | float | bool) -> str | float:
+        """
+        Return the value of a number key as number and the option of a select key and the state
+        of a switch key as string.
+        """
+        if command in SWITCH_SETTING_KEYS:
+            if isinstance(value, bool):
+                return "on" if value else "off"
+            if (state := str(value).lower()) not in ("on", "off"):
+                raise ServiceValidationError(
+                    f"Unable to apply {command}, {value} is not on or off"
+                )
+            return state
+
+        if command in SELECT_SETTING_KEYS:
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            return str(value).lower()
+
+        try:
+            return float(value)
+        except ValueError as ex:
+            raise ServiceValidationError(
+                f"Unable to apply {command}, {value} is not a number"
+            ) from ex
+
+    def _differs(self, command: str, value: str | float) -> bool:
+        """Return True if the value differs from the known value of the key."""
+        if (current := self.data.get(command)) is None:
+            return True
+
+        if isinstance(value, str):
+            return str(current).lower() != value
+
+        try:
+            return float(current) != float(value)
+        except ValueError:
+            return True
+
+    async def async_apply_settings(
+        self, settings: dict[str, str | float | bool], priority: int = PRIORITY_SERVICE
+    ) -> dict[str, list[str]]:
+        """
+        Apply a set of settings, only sending the ones that differ from the known state.
+
+        Only the keys of the number, select and switch entities can be set, numbers are send as
+        numbers, options in lowercase and switches as on or off. Keys that change other settings, like the picture mode, are
+        applied first after which the other keys are read again in one batch. The remaining
+        settings are written in one batch of absolute values, numeric keys that do not accept
+        absolute values are stepped.
+        """
+        if invalid := [
+            command
+            for command in settings
+            if command
+            not in NUMBER_SETTING_KEYS | SELECT_SETTING_KEYS | SWITCH_SETTING_KEYS
+        ]:
+            raise ServiceValidationError(
+                f"Unable to apply {', '.join(invalid)}, only the settings of number, select "
+                "and switch entities can be applied"
+            )
+
+        result = {"changed": [], "unchanged": [], "failed": [], "unsupported": []}
+
+        pending = {}
+        for command, value in settings.items():
+            if self.supports_command(command):
+                pending[command] = self._setting_value(command, value)
+            else:
+                result["unsupported"].append(command)
+
+        def action_for(value: str | float) -> str:
+            return value if isinstance(value, str) else str(int(value))
+
+        leading_changed = False
+        for command in LEADING_SETTING_KEYS:
+            if command not in pending:
+                continue
+            value = pending.pop(command)
+            if not self._differs(command, value):
+                result["unchanged"].append(command)
+                continue
+            action = action_for(value)
+            if (
+                await self.async_send_command(command, action, False, priority)
+                == action
+            ):
+                result["changed"].append(command)
+                leading_changed = True
+            else:
+                result["failed"].append(command)
+
+        if leading_changed and pending:
+            # The other settings may have changed with the leading settings
+            await self.async_send_batch(
+                [(command, "?") for command in pending], False, priority
+            )
+
+        writes = []
+        steps = []
+        for command, value in pending.items():
+            if not self._differs(command, value):
+                result["unchanged"].append(command)
+            elif (
+                not isinstance(value, str)
+                and self.absolute_value_support.get(command) is False
+            ):
+                steps.append(command)
+            else:
+                writes.append((command, action_for(value)))
+
+        option_writes = [
+            (command, action)
+            for command, action in writes
+            if isinstance(pending[command], str)
+        ]
+        value_writes = [
+            (command, action)
+            for command, action in writes
+            if not isinstance(pending[command], str)
+        ]
+
+        responses = await self.async_send_batch(option_writes, False, priority)
+        for (command, action), response in zip(option_writes, responses):
+            result["changed" if response == action else "failed"].append(command)
+
+        async def write_values() -> list[bool | None]:
+            return [
+                await self._async_send_absolute_value(command, action, False)
+                for command, action in value_writes
+            ]
+
+        accepted_values = (
+            await self._async_submit(write_values, priority) if value_writes else []
+        )
+        self.async_update_keys(
+            {
+                command: action
+                for (command, action), accepted in zip(value_writes, accepted_values)
+                if accepted
+            }
+        )
+        # The absolute value may have been applied even if the response got lost, these keys are
+        # read again before stepping
+        unknown = set()
+        for (command, _), accepted in zip(value_writes, accepted_values):
+            if accepted is not None:
+                self._async_record_absolute_value_support(command, accepted)
+            if accepted:
+                result["changed"].append(command)
+            else:
+                steps.append(command)
+                if accepted is None:
+                    unknown.add(command)
+
+        for command in steps:
+            try:
+                current = None if command in unknown else float(self.data[command])
+            except (KeyError, TypeError, ValueError):
+                current = None
+            value = await self.async_step_value(
+                command, current, float(pending[command])
+            )
+            if value is not None and not self._differs(command, value):
+                result["changed"].append(command)
+            else:
+                result["failed"].append(command)
+
+        return result
+
+    async def async_step_value(
+        self,
+        command: str,
+        value: float | None,
+        target: float | Callable[[], float],
+        step: float = 1,
+    ) -> float | None:
+        """
+        Step a numeric key to the target value using increments.
+
+        Increments are send in bursts of up to STEP_BURST_SIZE, every burst is a single job of
+        the command queue so the increments are send back to back without polling in between.
+        The actual value is read back from the projector after stepping. The target can be a
+        callable, in which case the stepping steers towards the latest target after every
+        increment. Returns the value after stepping.
+        """
+        get_target = target if callable(target) else lambda: target
+
+        if value is None:
+            response = await self.async_send_command(command)
+            if response is None:
+                return None
+            value = float(response)
+
+        while steps := round(abs(get_target() - value) / step):
+            action = "+" if value < get_target() else "-"
+            delta = step if action == "+" else -step
+
+            async def send_burst(
+                action: str = action, delta: float = delta, count: int = steps
+            ) -> bool:
+                """Send the increments of one burst, returns False if one failed."""
+                nonlocal value
+                for _ in range(min(count, STEP_BURST_SIZE)):
+                    if await self.projector.send_command(command, action) != action:
+                        return False
+                    value += delta
+                    if (get_target() - value) * delta <= 0:
+                        # The target has been reached or moved to the other direction
+                        break
+                return True
+
+            # Other jobs can use the connection between bursts
+            if not await self._async_submit(send_burst):
+                _LOGGER.error("Failed to step %s to %s", command, get_target())
+                break
+
+        return await self._async_reconcile_value(command, value)
+
+    async def _async_reconcile_value(self, command: str, value: float) -> float:
+        """Reconcile a stepped value with the actual value of the projector."""
+        response = await self.async_send_command(command)
+        if response is None:
+            self.async_update_keys({command: str(int(value))})
+            return value
+
+        try:
+            return float(response)
+        except ValueError:
+            return value
+
+    async def async_send_raw_command(
+        self, command: str, priority: int = PRIORITY_INTERACTIVE
+    ):
+        return await self._async_submit(
+            partial(self.projector.send_raw_command, command), priority
+        )
 
     async def async_turn_on(self) -> bool:
-        return await self.projector.turn_on()
+        result = await self._async_submit(self.projector.turn_on)
+        self.async_update_keys({"pow": self.projector.power_status})
+        return result
 
     async def async_turn_off(self) -> bool:
-        return await self.projector.turn_off()
+        result = await self._async_submit(self.projector.turn_off)
+        self.async_update_keys({"pow": self.projector.power_status})
+        return result
 
     async def async_mute(self) -> bool:
-        return await self.projector.mute()
+        result = await self._async_submit(self.projector.mute)
+        self.async_update_keys({"mute": self.projector.muted})
+        return result
 
     async def async_unmute(self) -> bool:
-        return await self.projector.unmute()
+        result = await self._async_submit(self.projector.unmute)
+        self.async_update_keys({"mute": self.projector.muted})
+        return result
 
     async def async_volume_level(self, volume: int):
-        return await self.projector.volume_level(volume)
+        result = await self._async_submit(partial(self.projector.volume_level, volume))
+        if result:
+            # The projector object does not track the volume when it is set directly
+            self.async_update_keys({"vol": volume})
+        return result
 
     async def async_volume_up(self):
-        return await self.projector.volume_up()
+        result = await self._async_submit(self.projector.volume_up)
+        if result:
+            self.async_update_keys({"vol": self.projector.volume, "mute": False})
+        return result
 
     async def async_volume_down(self):
-        return await self.projector.volume_down()
+        result = await self._async_submit(self.projector.volume_down)
+        if result:
+            self.async_update_keys({"vol": self.projector.volume, "mute": False})
+        return result
 
     async def async_select_video_source(self, source: str):
-        return await self.projector.select_video_source(source)
+        result = await self._async_submit(
+            partial(self.projector.select_video_source, source)
+        )
+        self.async_update_keys({"sour": self.projector.video_source})
+        return result
+
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the BenQ Projector integration."""
+    async_setup_services(hass)
+
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -200,13 +1181,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     interval = entry.options.get(CONF_INTERVAL, CONF_DEFAULT_INTERVAL)
 
     if conf_type == CONF_TYPE_TELNET:
-        serial_port = f"socket://{entry.data[CONF_HOST]}:{entry.data[CONF_PORT]}"
-        baud_rate = 2400
+        # The config flow already learned whether the connection uses a command prompt, this
+        # saves detecting it on every connect
+        projector = BenQProjectorNetwork(
+            entry.data[CONF_HOST],
+            entry.data[CONF_PORT],
+            model,
+            entry.data.get(CONF_HAS_PROMPT),
+        )
     else:
-        serial_port = entry.data[CONF_SERIAL_PORT]
-        baud_rate = entry.data[CONF_BAUD_RATE]
-
-    projector = BenQProjectorSerial(serial_port, baud_rate, model)
+        projector = BenQProjectorSerial(
+            entry.data[CONF_SERIAL_PORT], entry.data[CONF_BAUD_RATE], model
+        )
 
     @callback
     def _async_migrate_entity_entry(
@@ -231,52 +1217,69 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await er.async_migrate_entries(hass, entry.entry_id, _async_migrate_entity_entry)
 
-    # Open the connection.
-    if not await projector.connect(interval=interval):
-        raise ConfigEntryNotReady(f"Unable to connect to device {projector.unique_id}")
+    capability_cache = BenQProjectorCapabilityCache(hass, entry.entry_id)
+    await capability_cache.async_load()
+    capabilities = capability_cache.get(model)
 
-    _LOGGER.info("Device %s is available", projector.unique_id)
-
-    coordinator = BenQProjectorCoordinator(hass, projector)
-
-    entry.runtime_data = coordinator
+    if capabilities is None:
+        # The capabilities of the projector are not known yet, these are needed to create the
+        # entities. Open the connection, the coordinator takes care of polling.
+        if not await projector.connect():
+            raise ConfigEntryNotReady(
+                f"Unable to connect to device {projector.unique_id}"
+            )
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        _LOGGER.info("Device %s is available", projector.unique_id)
 
-    entry.async_on_unload(entry.add_update_listener(update_listener))
+    coordinator = BenQProjectorCoordinator(
+        hass,
+        projector,
+        capabilities,
+        capability_cache,
+        BenQProjectorSnapshots(hass, entry.entry_id),
+    )
 
-    async def async_handle_send(call: ServiceCall):
-        """Handle the send service call."""
-        command: str = call.data.get(CONF_SERVICE_COMMAND)
-        action: str = call.data.get(CONF_SERVICE_ACTION)
+    entry.runtime_data = coordinator
 
-        response = await coordinator.projector.send_command(command, action, False)
+    coordinator.platforms = coordinator.supported_platforms()
+    _LOGGER.debug(
+        "Setting up platforms %s for device %s",
+        ", ".join(coordinator.platforms),
+        coordinator.unique_id,
+    )
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
 
-        return {"response": response}
+    async def async_connect_and_revalidate() -> None:
+        """
+        Connect to the projector and revalidate the cached capabilities.
 
-    async def async_handle_send_raw(call: ServiceCall):
-        """Handle the send_raw service call."""
-        command: str = call.data.get(CONF_SERVICE_COMMAND)
+        The entities become available with the first successful poll after connecting.
+        """
+        await coordinator.async_connect()
 
-        response = await coordinator.async_send_raw_command(command)
+        if not await coordinator.async_revalidate_capabilities():
+            _LOGGER.info(
+                "Capabilities of device %s changed, reloading", coordinator.unique_id
+            )
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+            return
 
-        return {"response": response}
+        coordinator.async_start_polling(interval)
 
-    hass.services.async_register(
-        DOMAIN,
-        "send",
-        async_handle_send,
-        schema=SERVICE_SEND_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
+    if capabilities is None:
+        # The platforms have probed the supported commands, cache them for the next setup
+        await coordinator.async_save_capabilities()
+        coordinator.async_start_polling(interval)
+    else:
+        # Entities are created from the cached capabilities and start unavailable, setup does
+        # not wait for the projector connection
+        entry.async_create_background_task(
+            hass,
+            async_connect_and_revalidate(),
+            f"{DOMAIN} {coordinator.unique_id} connect",
+        )
 
-    hass.services.async_register(
-        DOMAIN,
-        "send_raw",
-        async_handle_send_raw,
-        schema=SERVICE_SEND_RAW_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
+    entry.async_on_unload(entry.add_update_listener(update_listener))
 
     return True
 
@@ -286,7 +1289,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator: BenQProjectorCoordinator = entry.runtime_data
     await coordinator.async_disconnect()
 
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    return await hass.config_entries.async_unload_platforms(
+        entry, coordinator.platforms
+    )
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached capabilities and snapshots when a config entry is removed."""
+    await BenQProjectorCapabilityCache(hass, entry.entry_id).async_remove()
+    await BenQProjectorSnapshots(hass, entry.entry_id).async_remove()
 
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -0,0 +1,63 @@
+"""Capability cache for the BenQ Projector Home Assistant integration."""
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Delay in seconds before capabilities learned at runtime are written to disk.
+SAVE_DELAY = 10
+
+
+class BenQProjectorCapabilityCache:
+    """
+    Stores the capabilities of a projector per config entry and model.
+
+    The capabilities are the unique id of the projector, the supported commands, the option
+    lists like the video sources and picture modes, and which keys accept absolute values.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._models: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the cached capabilities from disk."""
+        if (data := await self._store.async_load()) is not None:
+            self._models = data.get("models", {})
+
+    def get(self, model: str | None) -> dict[str, Any] | None:
+        """Return the cached capabilities for the given model."""
+        if model is None:
+            return None
+        return self._models.get(model)
+
+    async def async_save(self, model: str | None, capabilities: dict[str, Any]) -> None:
+        """Cache the capabilities of the given model and write them to disk."""
+        if model is None:
+            return
+
+        _LOGGER.debug("Saving capabilities of %s", model)
+        self._models[model] = capabilities
+        await self._store.async_save({"models": self._models})
+
+    def async_delay_save(self, model: str | None, capabilities: dict[str, Any]) -> None:
+        """Cache the capabilities of the given model and write them to disk after a delay."""
+        if model is None:
+            return
+
+        self._models[model] = capabilities
+        self._store.async_delay_save(lambda: {"models": self._models}, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the cached capabilities from disk."""
+        await self._store.async_remove()
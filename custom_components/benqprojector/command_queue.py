@@ -0,0 +1,143 @@
+"""Prioritized command queue for the BenQ Projector Home Assistant integration."""
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+
+# Priority classes, lower values are executed first.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_SERVICE = 1
+PRIORITY_POLL = 2
+# Idle jobs are preempted as soon as any other job is submitted, they then return None.
+PRIORITY_IDLE = 3
+
+# Weight of the last wait time in the average wait time.
+_WAIT_TIME_WEIGHT = 0.1
+# The number of latest wait times that are kept.
+_WAIT_TIME_SAMPLES = 256
+
+
+class BenQProjectorCommandQueue:
+    """
+    Executes the jobs that use the projector connection one at a time in order of priority.
+
+    Interactive jobs are executed before pending service calls and pending polling jobs, jobs
+    of the same priority are executed in order of submission. A running idle job is cancelled
+    when another job is submitted, so listening for unsolicited messages does not delay commands.
+    """
+
+    def __init__(
+        self, create_task: Callable[[Coroutine[Any, Any, None]], asyncio.Task]
+    ) -> None:
+        """
+        Initialize the command queue.
+
+        The worker is started with the given task factory, so its task is owned by whoever
+        creates the queue and is not garbage collected while jobs are waiting.
+        """
+        self._create_task = create_task
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._worker: asyncio.Task | None = None
+        self._stopped = False
+        self._idle_job: asyncio.Future | None = None
+
+        self.last_wait_time: float | None = None
+        self.average_wait_time: float | None = None
+        self.wait_times: deque[float] = deque(maxlen=_WAIT_TIME_SAMPLES)
+
+    @property
+    def depth(self) -> int:
+        """The number of jobs waiting to be executed."""
+        return self._queue.qsize()
+
+    async def async_submit(
+        self, job: Callable[[], Awaitable[Any]], priority: int = PRIORITY_INTERACTIVE
+    ) -> Any:
+        """Submit a job and wait for its result, jobs submitted after stopping are cancelled."""
+        future = asyncio.get_running_loop().create_future()
+        if self._stopped:
+            future.cancel()
+            return await future
+
+        self._queue.put_nowait(
+            (priority, next(self._sequence), time.monotonic(), job, future)
+        )
+
+        if (
+            priority < PRIORITY_IDLE
+            and self._idle_job is not None
+            and not self._idle_job.done()
+        ):
+            self._idle_job.cancel()
+
+        if self._worker is None or self._worker.done():
+            self._worker = self._create_task(self._async_worker())
+
+        return await future
+
+    async def _async_worker(self) -> None:
+        while True:
+            priority, _, submitted, job, future = await self._queue.get()
+            if future.done():
+                # The submitter is no longer waiting for the result
+                continue
+
+            if priority != PRIORITY_IDLE:
+                self._record_wait_time(time.monotonic() - submitted)
+
+            try:
+                if priority == PRIORITY_IDLE:
+                    result = await self._async_run_idle_job(job)
+                else:
+                    result = await job()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            # pylint: disable=broad-exception-caught
+            except Exception as ex:
+                if not future.done():
+                    future.set_exception(ex)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    def _record_wait_time(self, wait_time: float) -> None:
+        self.last_wait_time = wait_time
+        self.wait_times.append(wait_time)
+        if self.average_wait_time is None:
+            self.average_wait_time = wait_time
+        else:
+            self.average_wait_time += _WAIT_TIME_WEIGHT * (
+                wait_time - self.average_wait_time
+            )
+
+    async def _async_run_idle_job(self, job: Callable[[], Awaitable[Any]]) -> Any:
+        if self.depth > 0:
+            # Other jobs are already waiting
+            return None
+
+        self._idle_job = asyncio.ensure_future(job())
+        try:
+            await asyncio.wait([self._idle_job])
+        except asyncio.CancelledError:
+            self._idle_job.cancel()
+            raise
+
+        if self._idle_job.cancelled():
+            return None
+        return self._idle_job.result()
+
+    async def async_stop(self) -> None:
+        """Stop executing jobs and cancel the jobs that are still waiting."""
+        self._stopped = True
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+        while not self._queue.empty():
+            _, _, _, _, future = self._queue.get_nowait()
+            future.cancel()
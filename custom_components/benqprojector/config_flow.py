@@ -1,26 +1,21 @@
 """Config flow for the BenQ Projector integration."""
 
+import asyncio
+import ipaddress
 import logging
-import os
-from pathlib import Path
 from typing import Any
 
 import serial
 import serial.tools.list_ports
 import voluptuous as vol
-from benqprojector import (
-    BAUD_RATES,
-    DEFAULT_PORT,
-    BenQProjectorSerial,
-    BenQProjectorTelnet,
-)
+from benqprojector import BAUD_RATES, DEFAULT_PORT, BenQProjector, BenQProjectorSerial
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
     ConfigFlowResult,
     OptionsFlow,
 )
-from homeassistant.const import CONF_HOST, CONF_PORT, UnitOfTime
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TYPE, UnitOfTime
 from homeassistant.core import callback
 from homeassistant.helpers.selector import (
     NumberSelector,
@@ -34,89 +29,326 @@ from homeassistant.helpers.selector import (
     TextSelector,
 )
 
+from .connection import BenQProjectorNetwork
 from .const import (
     CONF_BAUD_RATE,
     CONF_DEFAULT_INTERVAL,
+    CONF_HAS_PROMPT,
     CONF_INTERVAL,
     CONF_MODEL,
     CONF_SERIAL_PORT,
+    CONF_TYPE_TELNET,
     DOMAIN,
 )
+from .probe import (
+    MAX_SCAN_HOSTS,
+    SCAN_CONCURRENCY,
+    BenQProjectorIdentity,
+    async_discover_serial_projectors,
+    async_identify_projector,
+    async_scan_network,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-USER_SCHEMA = vol.Schema(
+
+NETWORK_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_SERIAL_PORT, default=""): SerialPortSelector(),
-        vol.Required(CONF_BAUD_RATE): vol.In(BAUD_RATES),
+        vol.Required(CONF_HOST): TextSelector(),
+        vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=65535)
+        ),
     }
 )
 
 
+def _list_serial_ports() -> list[str]:
+    return [port.device for port in serial.tools.list_ports.comports()]
+
+
+def _parse_network(host: str) -> ipaddress.IPv4Network | ipaddress.IPv6Network | None:
+    """Return the network if the host is a network range like 192.168.1.0/24."""
+    if "/" not in host:
+        return None
+    try:
+        return ipaddress.ip_network(host.strip(), strict=False)
+    except ValueError:
+        return None
+
+
 class BenQProjectorConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for BenQ Projector."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        # The baud rate per serial port a projector was discovered on
+        self._discovered_serial_projectors: dict[str, int] | None = None
+        # Probing the serial ports can take a while, the progress is shown meanwhile
+        self._serial_discovery_task: asyncio.Task | None = None
+        # The projectors found by a network scan per host and the port they were found on
+        self._discovered_hosts: dict[str, BenQProjectorIdentity] = {}
+        self._scan_port: int = DEFAULT_PORT
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(
+            step_id="user", menu_options=["setup_serial", "setup_network"]
+        )
+
+    async def _async_identify(
+        self, projector: BenQProjector, errors: dict[str, str]
+    ) -> BenQProjectorIdentity | None:
+        """Test if we can connect to the projector and return what was learned about it."""
+        try:
+            identity = await async_identify_projector(projector)
+        except serial.SerialException:
+            identity = None
+
+        if identity is None:
+            errors["base"] = "cannot_connect"
+            return None
+
+        _LOGGER.info("Device %s available", identity.unique_id)
+
+        if identity.model is None and identity.power != "on":
+            errors["base"] = "cannot_detect_model_when_off"
+
+        return identity
+
+    async def _async_discover_serial_projectors(self) -> dict[str, int]:
+        """Probe all serial ports for projectors, the ports are probed concurrently."""
+        serial_ports = await self.hass.async_add_executor_job(_list_serial_ports)
+        configured_serial_ports = {
+            entry.data.get(CONF_SERIAL_PORT) for entry in self._async_current_entries()
+        }
+        return await async_discover_serial_projectors(
+            [
+                serial_port
+                for serial_port in serial_ports
+                if serial_port not in configured_serial_ports
+            ]
+        )
+
+    def _serial_schema(self, discovered: dict[str, int]) -> vol.Schema:
+        if not discovered:
+            return vol.Schema(
+                {
+                    vol.Required(CONF_SERIAL_PORT, default=""): SerialPortSelector(),
+                    vol.Required(CONF_BAUD_RATE): vol.In(BAUD_RATES),
+                }
+            )
+
+        return vol.Schema(
+            {
+                vol.Required(
+                    CONF_SERIAL_PORT, default=next(iter(discovered))
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[
+                            SelectOptionDict(
+                                value=serial_port, label=f"{serial_port} ({baud_rate})"
+                            )
+                            for serial_port, baud_rate in discovered.items()
+                        ],
+                        custom_value=True,
+                        mode=SelectSelectorMode.DROPDOWN,
+                    )
+                ),
+                # The detected baud rate is used if no baud rate is given
+                vol.Optional(CONF_BAUD_RATE): vol.In(BAUD_RATES),
+            }
+        )
+
+    async def async_step_setup_serial(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the serial projector step, the serial ports are probed for projectors first."""
+        if self._serial_discovery_task is None:
+            self._serial_discovery_task = self.hass.async_create_task(
+                self._async_discover_serial_projectors()
+            )
+        if not self._serial_discovery_task.done():
+            return self.async_show_progress(
+                step_id="setup_serial",
+                progress_action="discover_serial",
+                progress_task=self._serial_discovery_task,
+            )
+        if self._discovered_serial_projectors is None:
+            self._discovered_serial_projectors = self._serial_discovery_task.result()
+            return self.async_show_progress_done(next_step_id="setup_serial")
+
         errors: dict[str, str] = {}
 
+        discovered = self._discovered_serial_projectors
+        schema = self._serial_schema(discovered)
+
         if user_input is not None:
             # Validate user input.
-            USER_SCHEMA(user_input)
+            schema(user_input)
 
             serial_port = user_input[CONF_SERIAL_PORT]
-            baud_rate = user_input[CONF_BAUD_RATE]
-
-            model = None
-            unique_id = None
+            baud_rate = user_input.get(CONF_BAUD_RATE, discovered.get(serial_port))
 
-            # Test if we can connect to the device
-            try:
-                projector = BenQProjectorSerial(serial_port, baud_rate)
-                if not await projector.connect():
-                    errors["base"] = "cannot_connect"
-                else:
-                    _LOGGER.info("Device %s available", serial_port)
+            identity = None
 
-                    # Get model from the device
-                    model = projector.model
-
-                    if (
-                        model is None
-                        and projector.power_status != projector.POWERSTATUS_ON
-                    ):
-                        errors["base"] = "cannot_detect_model_when_off"
-
-                    unique_id = projector.unique_id
-                await projector.disconnect()
-            except serial.SerialException:
-                errors["base"] = "cannot_connect"
+            if baud_rate is None:
+                errors[CONF_BAUD_RATE] = "baud_rate_not_detected"
+            else:
+                identity = await self._async_identify(
+                    BenQProjectorSerial(serial_port, baud_rate), errors
+                )
 
             if not errors:
-                await self.async_set_unique_id(unique_id)
+                await self.async_set_unique_id(identity.unique_id)
                 self._abort_if_unique_id_configured()
 
-                title = f"BenQ {model}"
+                title = f"BenQ {identity.model}"
                 data = {
-                    CONF_MODEL: model,
+                    CONF_MODEL: identity.model,
                     CONF_SERIAL_PORT: serial_port,
                     CONF_BAUD_RATE: baud_rate,
                 }
                 return self.async_create_entry(title=title, data=data)
 
         # Combine user input with schema.
-        data_schema = self.add_suggested_values_to_schema(USER_SCHEMA, user_input or {})
+        data_schema = self.add_suggested_values_to_schema(schema, user_input or {})
+
+        return self.async_show_form(
+            step_id="setup_serial",
+            data_schema=data_schema,
+            errors=errors,
+        )
+
+    async def _async_create_network_entry(
+        self, host: str, port: int, errors: dict[str, str]
+    ) -> ConfigFlowResult | None:
+        """Create the entry for the network projector, or return None on errors."""
+        identity = await self._async_identify(BenQProjectorNetwork(host, port), errors)
+        if errors:
+            return None
+
+        await self.async_set_unique_id(identity.unique_id)
+        self._abort_if_unique_id_configured()
+
+        title = f"BenQ {identity.model}"
+        data = {
+            CONF_TYPE: CONF_TYPE_TELNET,
+            CONF_MODEL: identity.model,
+            CONF_HOST: host,
+            CONF_PORT: port,
+            CONF_HAS_PROMPT: identity.has_prompt,
+        }
+        return self.async_create_entry(title=title, data=data)
+
+    async def async_step_setup_network(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the network projector step, the host can also be a network to scan."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            # Validate user input.
+            user_input = NETWORK_SCHEMA(user_input)
+
+            host = user_input[CONF_HOST].strip()
+            port = user_input[CONF_PORT]
+
+            if (network := _parse_network(host)) is None:
+                if result := await self._async_create_network_entry(host, port, errors):
+                    return result
+            elif network.num_addresses > MAX_SCAN_HOSTS:
+                errors[CONF_HOST] = "network_too_large"
+            else:
+                configured_hosts = {
+                    entry.data.get(CONF_HOST)
+                    for entry in self._async_current_entries()
+                    if entry.data.get(CONF_PORT) == port
+                }
+                hosts = await async_scan_network(network, port, configured_hosts)
+                self._discovered_hosts = await self._async_identify_hosts(hosts, port)
+                self._scan_port = port
+                if self._discovered_hosts:
+                    return await self.async_step_select_network_projector()
+                errors[CONF_HOST] = "no_projectors_found"
+
+        # Combine user input with schema.
+        data_schema = self.add_suggested_values_to_schema(
+            NETWORK_SCHEMA, user_input or {}
+        )
 
         return self.async_show_form(
-            step_id="user",
+            step_id="setup_network",
             data_schema=data_schema,
             errors=errors,
         )
 
+    async def _async_identify_hosts(
+        self, hosts: list[str], port: int
+    ) -> dict[str, BenQProjectorIdentity]:
+        """
+        Identify the projectors on the hosts concurrently.
+
+        Projectors that are already configured, possibly under another host, are left out.
+        """
+        semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+        async def identify(host: str) -> BenQProjectorIdentity | None:
+            async with semaphore:
+                return await async_identify_projector(BenQProjectorNetwork(host, port))
+
+        identities = await asyncio.gather(*(identify(host) for host in hosts))
+        configured_ids = self._async_current_ids()
+        return {
+            host: identity
+            for host, identity in zip(hosts, identities)
+            if identity is not None and identity.unique_id not in configured_ids
+        }
+
+    async def async_step_select_network_projector(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the selection of a projector found by a network scan."""
+        errors: dict[str, str] = {}
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_HOST, default=next(iter(self._discovered_hosts))
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[
+                            SelectOptionDict(
+                                value=host,
+                                label=f"BenQ {identity.model or 'projector'} ({host})",
+                            )
+                            for host, identity in self._discovered_hosts.items()
+                        ],
+                        mode=SelectSelectorMode.LIST,
+                    )
+                ),
+            }
+        )
+
+        if user_input is not None:
+            # Validate user input.
+            schema(user_input)
+
+            if result := await self._async_create_network_entry(
+                user_input[CONF_HOST], self._scan_port, errors
+            ):
+                return result
+
+        return self.async_show_form(
+            step_id="select_network_projector",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders={"port": str(self._scan_port)},
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -0,0 +1,102 @@
+"""Network connection for the BenQ Projector Home Assistant integration."""
+
+import asyncio
+import logging
+import socket
+
+from benqprojector import BenQProjectorTelnet
+from benqprojector.benqconnection import (
+    DEFAULT_PORT,
+    BenQConnectionError,
+    BenQTelnetConnection,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds of idle time before TCP keepalive probes are send, the interval between probes and
+# the number of unanswered probes after which the connection is considered dead.
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+
+# Seconds to wait for more data when discarding stale data before sending a command.
+RESET_TIMEOUT = 0.01
+
+
+class BenQProjectorTCPConnection(BenQTelnetConnection):
+    """
+    Asyncio stream connection to a networked projector or serial to network bridge.
+
+    Commands are send without delay and dead connections are detected by TCP keepalive. Stale
+    data is discarded before sending a command without waiting for the full read timeout.
+    """
+
+    async def open(self) -> bool:
+        was_open = self.is_open()
+        result = await super().open()
+
+        if result and not was_open and self.is_open():
+            self._configure_socket(self._writer.get_extra_info("socket"))
+
+        return result
+
+    @staticmethod
+    def _configure_socket(sock: socket.socket | None) -> None:
+        if sock is None:
+            return
+
+        try:
+            # Commands are short, send them right away instead of waiting for more data
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL
+                )
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT)
+        except OSError as ex:
+            _LOGGER.debug("Unable to configure socket: %s", ex)
+
+    async def reset(self) -> bool:
+        """Discard the data received so far without waiting for the full read timeout."""
+        if not self.is_open():
+            return False
+
+        try:
+            while not self._reader.at_eof():
+                try:
+                    data = await asyncio.wait_for(
+                        self._reader.read(1024), timeout=RESET_TIMEOUT
+                    )
+                except TimeoutError:
+                    break
+                if not data:
+                    break
+            await self._writer.drain()
+        except OSError as ex:
+            await self.close()
+            raise BenQConnectionError(str(ex)) from ex
+
+        return True
+
+
+class BenQProjectorNetwork(BenQProjectorTelnet):
+    """BenQ Projector connected over the network using a native asyncio stream."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_PORT,
+        model_hint: str | None = None,
+        has_prompt: bool | None = None,
+    ) -> None:
+        super().__init__(host, port, model_hint, has_prompt)
+
+        self.connection = BenQProjectorTCPConnection(host, port)
+
+        # Network projectors used to be connected as socket:// serial port, keep the same
+        # device identifier for projectors that do not report a MAC address
+        self.unique_id = f"socket://{host}:{port}"
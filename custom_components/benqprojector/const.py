@@ -10,5 +10,6 @@ CONF_TYPE_TELNET: Final = "telnet"
 
 CONF_SERIAL_PORT: Final = "serial_port"
 CONF_BAUD_RATE: Final = "baud_rate"
+CONF_HAS_PROMPT: Final = "has_prompt"
 CONF_INTERVAL: Final = "interval"
 CONF_DEFAULT_INTERVAL: Final = 5
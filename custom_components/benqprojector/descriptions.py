@@ -0,0 +1,234 @@
+"""Entity descriptions of the BenQ Projector Home Assistant integration."""
+
+from dataclasses import dataclass
+
+from homeassistant.components.number import NumberEntityDescription
+from homeassistant.components.select import SelectEntityDescription
+from homeassistant.components.switch import SwitchEntityDescription
+from homeassistant.helpers.entity import EntityCategory
+
+
+@dataclass(frozen=True, kw_only=True)
+class BenQProjectorSelectEntityDescription(SelectEntityDescription):
+    """Describes a BenQ Projector select, the options come from the projector capabilities."""
+
+    option_list: str
+
+
+NUMBER_ENTITY_DESCRIPTIONS: tuple[NumberEntityDescription, ...] = (
+    NumberEntityDescription(key="con", translation_key="con", native_max_value=100),
+    NumberEntityDescription(key="bri", translation_key="bri", native_max_value=100),
+    NumberEntityDescription(key="color", translation_key="color", native_max_value=20),
+    NumberEntityDescription(key="sharp", translation_key="sharp", native_max_value=20),
+    NumberEntityDescription(
+        key="micvol", translation_key="micvol", native_max_value=20
+    ),
+    NumberEntityDescription(
+        key="keyst",
+        translation_key="keyst",
+        native_max_value=20,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    NumberEntityDescription(
+        key="hkeystone",
+        translation_key="hkeystone",
+        native_max_value=20,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    NumberEntityDescription(
+        key="vkeystone",
+        translation_key="vkeystone",
+        native_max_value=20,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    NumberEntityDescription(
+        key="rgain",
+        translation_key="rgain",
+        native_max_value=200,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    NumberEntityDescription(
+        key="ggain",
+        translation_key="ggain",
+        native_max_value=200,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    NumberEntityDescription(
+        key="bgain",
+        translation_key="bgain",
+        native_max_value=200,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    NumberEntityDescription(
+        key="roffset",
+        translation_key="roffset",
+        native_max_value=511,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    NumberEntityDescription(
+        key="goffset",
+        translation_key="goffset",
+        native_max_value=511,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    NumberEntityDescription(
+        key="boffset",
+        translation_key="boffset",
+        native_max_value=511,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    # NumberEntityDescription(key="gamma", translation_key="gamma", native_min_value=1.6, native_max_value=2.8, native_step=0.1, entity_category=EntityCategory.CONFIG, entity_registry_enabled_default=False,),
+    NumberEntityDescription(
+        key="hdrbri",
+        translation_key="hdrbri",
+        native_min_value=-2,
+        native_max_value=2,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+SELECT_ENTITY_DESCRIPTIONS: tuple[BenQProjectorSelectEntityDescription, ...] = (
+    BenQProjectorSelectEntityDescription(
+        key="audiosour",
+        translation_key="audiosour",
+        option_list="audio_sources",
+    ),
+    BenQProjectorSelectEntityDescription(
+        key="appmod",
+        translation_key="appmod",
+        option_list="picture_modes",
+    ),
+    BenQProjectorSelectEntityDescription(
+        key="ct",
+        translation_key="ct",
+        option_list="color_temperatures",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    BenQProjectorSelectEntityDescription(
+        key="asp",
+        translation_key="asp",
+        option_list="aspect_ratios",
+    ),
+    BenQProjectorSelectEntityDescription(
+        key="lampm",
+        translation_key="lampm",
+        option_list="lamp_modes",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    BenQProjectorSelectEntityDescription(
+        key="3d",
+        translation_key="3d",
+        option_list="threed_modes",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    # BenQProjectorSelectEntityDescription(key="rr", None, translation_key="rr", entity_category=EntityCategory.CONFIG],
+    BenQProjectorSelectEntityDescription(
+        key="pp",
+        translation_key="pp",
+        option_list="projector_positions",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    BenQProjectorSelectEntityDescription(
+        key="menuposition",
+        translation_key="menuposition",
+        option_list="menu_positions",
+        entity_category=EntityCategory.CONFIG,
+    ),
+)
+
+SWITCH_ENTITY_DESCRIPTIONS: tuple[SwitchEntityDescription, ...] = (
+    SwitchEntityDescription(
+        key="bc",
+        translation_key="bc",
+    ),
+    SwitchEntityDescription(
+        key="qas",
+        translation_key="qas",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="directpower",
+        translation_key="directpower",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="autopower",
+        translation_key="autopower",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="standbynet",
+        translation_key="standbynet",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="standbymic",
+        translation_key="standbymic",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="standbymnt",
+        translation_key="standbymnt",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(key="blank", translation_key="blank"),
+    SwitchEntityDescription(key="freeze", translation_key="freeze"),
+    SwitchEntityDescription(
+        key="ins",
+        translation_key="ins",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="lpsaver",
+        translation_key="lpsaver",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="prjlogincode",
+        translation_key="prjlogincode",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="broadcasting",
+        translation_key="broadcasting",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="amxdd",
+        translation_key="amxdd",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="highaltitude",
+        translation_key="highaltitude",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    SwitchEntityDescription(
+        key="led",
+        translation_key="led",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+)
@@ -0,0 +1,72 @@
+"""Diagnostics support for the BenQ Projector Home Assistant integration."""
+
+import re
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from . import BenQProjectorCoordinator
+from .link_statistics import percentile
+
+# The unique id of a projector is its MAC address, if the projector reports one.
+TO_REDACT = {CONF_HOST, "unique_id", "macaddr"}
+
+# IP addresses in the reasons of connection events, like "Connect call failed ('192.168.1.10',
+# 4352)". A host name can resolve to an address, so these are redacted whatever the host is.
+_ADDRESS_RE = re.compile(
+    r"\b(?:\d{1,3}\.){3}\d{1,3}\b|(?:[0-9a-f]{0,4}:){2,7}[0-9a-f]{0,4}", re.IGNORECASE
+)
+
+
+def _redact_link(link: dict[str, Any], host: str | None) -> dict[str, Any]:
+    """Redact the host from the reasons of the connection events."""
+
+    def redact_reason(reason: str | None) -> str | None:
+        if reason is None:
+            return None
+        if host:
+            reason = reason.replace(host, REDACTED)
+        return _ADDRESS_RE.sub(REDACTED, reason)
+
+    return {
+        **link,
+        "connection_events": [
+            {**event, "reason": redact_reason(event["reason"])}
+            for event in link["connection_events"]
+        ],
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: BenQProjectorCoordinator = entry.runtime_data
+    command_queue = coordinator.command_queue
+    wait_times = list(command_queue.wait_times)
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "model": coordinator.model,
+        "connected": coordinator.projector.connection.is_open(),
+        "last_update_success": coordinator.last_update_success,
+        "capabilities": async_redact_data(coordinator.capabilities, TO_REDACT),
+        "state": async_redact_data(coordinator.data, TO_REDACT),
+        "poll_intervals": coordinator.polling_planner.next_poll_intervals(),
+        "command_queue": {
+            "depth": command_queue.depth,
+            "last_wait_time": command_queue.last_wait_time,
+            "average_wait_time": command_queue.average_wait_time,
+            "p95_wait_time": percentile(wait_times, 95),
+            "max_wait_time": max(wait_times, default=None),
+        },
+        "link": _redact_link(
+            coordinator.link_statistics.as_dict(), entry.data.get(CONF_HOST)
+        ),
+    }
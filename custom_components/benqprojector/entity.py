@@ -0,0 +1,135 @@
+"""Base entity for the BenQ Projector Home Assistant integration."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import BenQProjectorCoordinator
+from .polling import POLL_CLASS_SLOW
+
+
+class BenQProjectorEntity(CoordinatorEntity):
+    """Base BenQ Projector Entity."""
+
+    coordinator: BenQProjectorCoordinator
+
+    _attr_has_entity_name = True
+    _attr_available = False
+
+    # The polling class of the key of the entity, None leaves the polling class of the key as is
+    _attr_poll_class: str | None
+
+    # The state, availability and attributes as last written to Home Assistant
+    _written_state: tuple | None = None
+
+    @property
+    def poll_class(self) -> str | None:
+        """Return the polling class of the key of the entity."""
+        if hasattr(self, "_attr_poll_class"):
+            return self._attr_poll_class
+
+        if self.entity_category in [EntityCategory.CONFIG, EntityCategory.DIAGNOSTIC]:
+            # Configuration and diagnostic values rarely change
+            return POLL_CLASS_SLOW
+
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """Called when entity is added to Home Assistant."""
+        await super().async_added_to_hass()
+
+        if (
+            isinstance(self.coordinator_context, str)
+            and (poll_class := self.poll_class) is not None
+        ):
+            self.coordinator.polling_planner.set_poll_class(
+                self.coordinator_context, poll_class
+            )
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        if not self._attr_available:
+            return self._attr_available
+
+        return self.coordinator.last_update_success
+
+    def _current_state(self) -> tuple:
+        return (
+            self.available,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
+
+    @callback
+    def _async_create_write_task(
+        self, target: Coroutine[Any, Any, None]
+    ) -> asyncio.Task:
+        """Create the task of a value writer, Home Assistant keeps track of it."""
+        return self.hass.async_create_task(target, f"{self.entity_id} write")
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine and remember what was written."""
+        self._written_state = self._current_state()
+        super().async_write_ha_state()
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> None:
+        """Write the state to the state machine only if it differs from the last write."""
+        if self._current_state() != self._written_state:
+            self.async_write_ha_state()
+
+
+class BenQProjectorValueWriter:
+    """
+    Writes values to the projector where only the latest requested value is pursued.
+
+    While a value is being written new values are not queued but replace the target of the
+    write in progress, the writer continues with the latest target once the current write is
+    done. All callers wait until the latest target has been written.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Any], Awaitable[None]],
+        create_task: Callable[[Coroutine[Any, Any, None]], asyncio.Task],
+    ) -> None:
+        self._write = write
+        self._create_task = create_task
+        self._task: asyncio.Task | None = None
+        self.target: Any = None
+
+    @property
+    def busy(self) -> bool:
+        """True if a value is being written."""
+        return self._task is not None and not self._task.done()
+
+    async def async_write(self, value: Any) -> None:
+        """Write the value, or replace the target of the write in progress."""
+        self.target = value
+
+        if not self.busy:
+            self._task = self._create_task(self._async_write_latest())
+
+        # Shield the write so a cancelled caller does not cancel the write of other callers
+        await asyncio.shield(self._task)
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel the write in progress, for instance when the entity is removed."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_write_latest(self) -> None:
+        while True:
+            target = self.target
+            await self._write(target)
+            if self.target == target:
+                break
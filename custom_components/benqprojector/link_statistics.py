@@ -0,0 +1,339 @@
+"""Link statistics for the BenQ Projector Home Assistant integration."""
+
+import re
+import time
+from collections import Counter, deque
+from datetime import UTC, datetime
+from functools import wraps
+from typing import Any
+
+from benqprojector.benqconnection import BenQConnection
+
+# The number of latest samples that are kept for the latency and duration statistics.
+SAMPLE_SIZE = 256
+# The number of latest connection events that are kept.
+EVENT_HISTORY_SIZE = 20
+# The number of distinct keys that are counted, other keys are counted together.
+MAX_COUNTED_KEYS = 128
+COUNTER_OTHER_KEYS = "other"
+# The window in seconds of the per minute rates.
+RATE_WINDOW = 60
+
+# The library gives up waiting for a response after 5 seconds, failed commands that took at
+# least this long are counted as timeouts.
+RESPONSE_TIMEOUT = 5.0
+
+# A response line is either a command prompt, a command echo or a response like *pow=on#, or
+# one of the error responses that some models send without the * and #.
+_PARSEABLE_RE = re.compile(
+    r"^(>|>?\*[^#]*#|illegal format|unsupported item|block item)$", re.IGNORECASE
+)
+_WHITESPACE = b" \t\r\n\x00"
+# A command as written to the connection, like *pow=?# or *vol=+#.
+_COMMAND_RE = re.compile(rb"\*([a-z0-9]+)=[^#]*#", re.IGNORECASE)
+_ERROR_RESPONSES = (b"illegal format", b"unsupported item", b"block item")
+
+
+def percentile(samples: list[float], rank: float) -> float | None:
+    """Return the given percentile of the samples."""
+    if not samples:
+        return None
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * rank / 100))]
+
+
+class BenQProjectorLinkStatistics:
+    """
+    Collects performance counters of the link to a projector.
+
+    All counters have a fixed size, latencies and durations are kept for the latest samples
+    only and the rates are counted in one second buckets over the last minute. Recording a
+    sample is cheap enough to always be enabled.
+    """
+
+    def __init__(self) -> None:
+        self.command_counts: Counter[str] = Counter()
+        self.commands = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.push_updates = 0
+        self.unparseable_responses = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.last_latency: float | None = None
+
+        self._latencies: deque[float] = deque(maxlen=SAMPLE_SIZE)
+        self._sweep_durations: deque[float] = deque(maxlen=SAMPLE_SIZE)
+        self._events: deque[tuple[str, str, str | None]] = deque(
+            maxlen=EVENT_HISTORY_SIZE
+        )
+        # Per second buckets of the number of commands and errors, indexed by second modulo
+        # the window size
+        self._rate_buckets: list[list[int]] = [[0, 0, 0] for _ in range(RATE_WINDOW)]
+
+        self.connected_since: float | None = None
+        self.connected_at: datetime | None = None
+
+        # The command that was written and is waiting for its response, with the time it was
+        # written
+        self._pending_command: tuple[str, bytes, float] | None = None
+        self._echo_received_at: float | None = None
+
+    def _rate_bucket(self, now: float) -> list[int]:
+        second = int(now)
+        bucket = self._rate_buckets[second % RATE_WINDOW]
+        if bucket[0] != second:
+            bucket[:] = [second, 0, 0]
+        return bucket
+
+    def record_command(self, key: str, latency: float, success: bool) -> None:
+        """Record the round trip of a single command."""
+        if key in self.command_counts or len(self.command_counts) < MAX_COUNTED_KEYS:
+            self.command_counts[key] += 1
+        else:
+            self.command_counts[COUNTER_OTHER_KEYS] += 1
+        self.commands += 1
+
+        bucket = self._rate_bucket(time.monotonic())
+        bucket[1] += 1
+
+        if success:
+            self.last_latency = latency
+            self._latencies.append(latency)
+            return
+
+        self.errors += 1
+        bucket[2] += 1
+        if latency >= RESPONSE_TIMEOUT:
+            self.timeouts += 1
+
+    def record_write(self, data: bytes) -> None:
+        """Record data as written to the connection, a command starts a round trip."""
+        self.bytes_out += len(data)
+        if (match := _COMMAND_RE.search(data)) is None:
+            return
+
+        # The previous command is still waiting for its response
+        self._finish_pending_command()
+        self._pending_command = (
+            match.group(1).decode(errors="ignore").lower(),
+            match.group(0).lower(),
+            time.monotonic(),
+        )
+        self._echo_received_at = None
+
+    def _finish_command(self, success: bool, end: float | None = None) -> None:
+        key, _, start = self._pending_command
+        self._pending_command = None
+        self.record_command(key, (end or time.monotonic()) - start, success)
+
+    def _finish_pending_command(self) -> None:
+        """
+        Finish the pending command without having seen a response other than its echo.
+
+        The response to setting a value can be identical to the command, projectors that do not
+        echo commands only send that response. It is taken for the response if it was received
+        before the library gave up waiting.
+        """
+        if self._pending_command is None:
+            return
+
+        if (
+            echo_received_at := self._echo_received_at
+        ) is not None and echo_received_at - self._pending_command[
+            2
+        ] < RESPONSE_TIMEOUT:
+            self._finish_command(True, echo_received_at)
+        else:
+            self._finish_command(False)
+
+    def _record_response_line(self, line: bytes) -> None:
+        if self._pending_command is None:
+            return
+
+        if not (line := line.lstrip(b">").lower()):
+            # A prompt
+            return
+
+        if line == self._pending_command[1] and self._echo_received_at is None:
+            # The command echo, or the response of a projector that does not echo commands
+            self._echo_received_at = time.monotonic()
+            return
+
+        self._finish_command(not line.strip(b"*#").startswith(_ERROR_RESPONSES))
+
+    def record_retry(self) -> None:
+        """Record that an operation on the link is retried."""
+        self.retries += 1
+
+    def record_push(self, keys: int) -> None:
+        """Record the number of keys updated by unsolicited status messages."""
+        self.push_updates += keys
+
+    def record_sweep(self, duration: float) -> None:
+        """Record the duration of a polling sweep."""
+        self._sweep_durations.append(duration)
+
+    def record_connection_event(self, event: str, reason: str | None = None) -> None:
+        """Record a connection event, like connected, disconnected or failed."""
+        now = datetime.now(UTC)
+        if event == "connected":
+            self.connected_since = time.monotonic()
+            self.connected_at = now
+        elif event == "disconnected":
+            self.connected_since = None
+            self.connected_at = None
+
+        self._events.append((now.isoformat(), event, reason))
+
+    def latency_percentile(self, rank: float) -> float | None:
+        """Return the given percentile of the latest successful command latencies."""
+        return percentile(list(self._latencies), rank)
+
+    def _rates(self) -> tuple[int, int]:
+        """Return the number of commands and errors of the last minute."""
+        since = int(time.monotonic()) - RATE_WINDOW
+        commands = errors = 0
+        for second, bucket_commands, bucket_errors in self._rate_buckets:
+            if second > since:
+                commands += bucket_commands
+                errors += bucket_errors
+        return commands, errors
+
+    @property
+    def commands_per_minute(self) -> int:
+        """The number of commands send in the last minute."""
+        return self._rates()[0]
+
+    @property
+    def error_rate(self) -> float | None:
+        """The fraction of the commands of the last minute that failed."""
+        commands, errors = self._rates()
+        if commands == 0:
+            return None
+        return errors / commands
+
+    @property
+    def uptime(self) -> float | None:
+        """The number of seconds the connection has been open."""
+        if self.connected_since is None:
+            return None
+        return time.monotonic() - self.connected_since
+
+    def record_response(self, data: bytes) -> None:
+        """
+        Record the response lines as read from the connection.
+
+        The first line after a command that is not its echo or a prompt completes the round
+        trip of the command, it failed if the line is an error response.
+        """
+        self.bytes_in += len(data)
+        for line in data.splitlines():
+            if not (line := line.strip(_WHITESPACE)):
+                continue
+            if not _PARSEABLE_RE.match(line.decode(errors="ignore")):
+                self.unparseable_responses += 1
+            self._record_response_line(line)
+
+    def instrument(self, connection: BenQConnection) -> None:
+        """Count the bytes and connection events of a projector connection."""
+
+        def wrap_read(read):
+            @wraps(read)
+            async def wrapper(*args, **kwargs):
+                data = await read(*args, **kwargs)
+                if data:
+                    self.record_response(data)
+                return data
+
+            return wrapper
+
+        def wrap_write(write):
+            @wraps(write)
+            async def wrapper(data: bytes):
+                written = await write(data)
+                if written:
+                    self.record_write(data)
+                return written
+
+            return wrapper
+
+        def wrap_open(open_connection):
+            @wraps(open_connection)
+            async def wrapper():
+                was_open = connection.is_open()
+                try:
+                    result = await open_connection()
+                except Exception as ex:
+                    self.record_connection_event("failed", str(ex))
+                    raise
+                if not was_open:
+                    if connection.is_open():
+                        self.record_connection_event("connected")
+                    else:
+                        self.record_connection_event("failed")
+                return result
+
+            return wrapper
+
+        def wrap_close(close):
+            @wraps(close)
+            async def wrapper():
+                was_open = connection.is_open()
+                result = await close()
+                if was_open and not connection.is_open():
+                    self._finish_pending_command()
+                    self.record_connection_event("disconnected")
+                return result
+
+            return wrapper
+
+        connection.read = wrap_read(connection.read)
+        connection.readline = wrap_read(connection.readline)
+        connection.readuntil = wrap_read(connection.readuntil)
+        connection.write = wrap_write(connection.write)
+        connection.open = wrap_open(connection.open)
+        connection.close = wrap_close(connection.close)
+
+        if connection.is_open():
+            self.record_connection_event("connected")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        latencies = list(self._latencies)
+        sweep_durations = list(self._sweep_durations)
+        return {
+            "commands": self.commands,
+            "command_counts": dict(self.command_counts.most_common()),
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "push_updates": self.push_updates,
+            "unparseable_responses": self.unparseable_responses,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "latency": {
+                "last": self.last_latency,
+                "p50": percentile(latencies, 50),
+                "p90": percentile(latencies, 90),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "max": max(latencies, default=None),
+                "samples": len(latencies),
+            },
+            "sweep_duration": {
+                "last": sweep_durations[-1] if sweep_durations else None,
+                "p50": percentile(sweep_durations, 50),
+                "p95": percentile(sweep_durations, 95),
+                "max": max(sweep_durations, default=None),
+                "samples": len(sweep_durations),
+            },
+            "commands_per_minute": self.commands_per_minute,
+            "error_rate": self.error_rate,
+            "uptime": self.uptime,
+            "connection_events": [
+                {"time": timestamp, "event": event, "reason": reason}
+                for timestamp, event, reason in self._events
+            ],
+        }
@@ -12,9 +12,9 @@ from homeassistant.components.media_player import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import BenQProjectorCoordinator
+from . import MEDIA_PLAYER_KEYS, BenQProjectorCoordinator
+from .entity import BenQProjectorEntity, BenQProjectorValueWriter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,10 +30,9 @@ async def async_setup_entry(
     async_add_entities([BenQProjectorMediaPlayer(coordinator, config_entry.entry_id)])
 
 
-class BenQProjectorMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
+class BenQProjectorMediaPlayer(BenQProjectorEntity, MediaPlayerEntity):
     """Base BenQ Projector Media Player."""
 
-    _attr_has_entity_name = True
     _attr_name = None
     _attr_device_class = MediaPlayerDeviceClass.TV
     _attr_translation_key = "projector"
@@ -46,7 +45,6 @@ class BenQProjectorMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         | MediaPlayerEntityFeature.SELECT_SOURCE
     )
 
-    _attr_available = False
     _attr_state = None
 
     _attr_source_list = None
@@ -59,11 +57,15 @@ class BenQProjectorMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         self, coordinator: BenQProjectorCoordinator, config_entry_id: str
     ) -> None:
         """Initialize the media player."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, MEDIA_PLAYER_KEYS)
 
         self._attr_device_info = coordinator.device_info
         self._attr_unique_id = f"{config_entry_id}-projector"
 
+        self._volume_writer = BenQProjectorValueWriter(
+            self._async_write_volume, self._async_create_write_task
+        )
+
     def _get_source_translation_key(self, source: str):
         """
         Projectors can have 1 or multiple sources for HDMI, RGB and YPBR. In case multiple sources
@@ -85,6 +87,8 @@ class BenQProjectorMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Called when media player is added to Home Assistant."""
         await super().async_added_to_hass()
 
+        self.async_on_remove(self._volume_writer.cancel)
+
         self._attr_source_list = self.coordinator.video_sources
         source_list = [
             self._get_source_translation_key(source)
@@ -92,72 +96,44 @@ class BenQProjectorMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         ]
         self._attr_source_list = source_list
 
-        if self.coordinator.power_status == BenQProjector.POWERSTATUS_UNKNOWN:
+        self._update_from_coordinator()
+        if not self._attr_available:
             _LOGGER.debug("Projector is not available")
-            self._attr_available = False
-        elif self.coordinator.power_status in [
-            BenQProjector.POWERSTATUS_POWERINGON,
-            BenQProjector.POWERSTATUS_ON,
-        ]:
-            self._attr_state = MediaPlayerState.ON
-
-            if self.coordinator.volume is not None:
-                self._attr_volume_level = self.coordinator.volume / 20
-
-            self._attr_is_volume_muted = self.coordinator.muted
-
-            self._attr_source = self._get_source_translation_key(
-                self.coordinator.video_source
-            )
-
-            self._attr_available = True
-        elif self.coordinator.power_status == BenQProjector.POWERSTATUS_POWERINGOFF:
-            self._attr_state = MediaPlayerState.OFF
-            self._attr_available = False
-        elif self.coordinator.power_status == BenQProjector.POWERSTATUS_OFF:
-            self._attr_state = MediaPlayerState.OFF
-            self._attr_available = True
 
         self.async_write_ha_state()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not self._attr_available:
-            return self._attr_available
-
-        return self.coordinator.last_update_success
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.power_status == BenQProjector.POWERSTATUS_UNKNOWN:
+    def _update_from_coordinator(self) -> None:
+        """Update the media player attributes from the coordinator state."""
+        power_status = self.coordinator.power_status
+        if power_status == BenQProjector.POWERSTATUS_UNKNOWN:
             self._attr_available = False
-        elif self.coordinator.power_status in [
+        elif power_status in [
             BenQProjector.POWERSTATUS_POWERINGON,
             BenQProjector.POWERSTATUS_ON,
         ]:
             self._attr_state = MediaPlayerState.ON
             self._attr_available = True
-        elif self.coordinator.power_status == BenQProjector.POWERSTATUS_POWERINGOFF:
+        elif power_status == BenQProjector.POWERSTATUS_POWERINGOFF:
             self._attr_state = MediaPlayerState.OFF
             self._attr_available = False
-        elif self.coordinator.power_status == BenQProjector.POWERSTATUS_OFF:
+        elif power_status == BenQProjector.POWERSTATUS_OFF:
             self._attr_state = MediaPlayerState.OFF
             self._attr_available = True
 
-        if "vol" in self.coordinator.data:
-            self._attr_volume_level = self.coordinator.data.get("vol") / 20.0
+        if (volume := self.coordinator.volume) is not None:
+            self._attr_volume_level = volume / 20.0
 
-        if "mute" in self.coordinator.data:
-            self._attr_is_volume_muted = self.coordinator.data.get("mute")
+        if (muted := self.coordinator.muted) is not None:
+            self._attr_is_volume_muted = muted
 
-        if "sour" in self.coordinator.data:
-            self._attr_source = self._get_source_translation_key(
-                self.coordinator.data.get("sour")
-            )
+        if (video_source := self.coordinator.video_source) is not None:
+            self._attr_source = self._get_source_translation_key(video_source)
 
-        self.async_write_ha_state()
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        self.async_write_ha_state_if_changed()
 
     async def async_turn_on(self) -> None:
         """Turn projector on."""
@@ -182,10 +158,12 @@ class BenQProjectorMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        volume = int(volume * 20.0)
+        await self._volume_writer.async_write(int(volume * 20.0))
+        self.async_write_ha_state()
+
+    async def _async_write_volume(self, volume: int) -> None:
         if await self.coordinator.async_volume_level(volume):
             self._attr_volume_level = self.coordinator.volume / 20.0
-            self.async_write_ha_state()
 
     async def async_volume_up(self) -> None:
         """Increase volume."""
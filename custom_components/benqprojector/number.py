@@ -6,11 +6,11 @@ from benqprojector import BenQProjector
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BenQProjectorCoordinator
+from .descriptions import NUMBER_ENTITY_DESCRIPTIONS
+from .entity import BenQProjectorEntity, BenQProjectorValueWriter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,95 +23,9 @@ async def async_setup_entry(
     """Set up the BenQ Serial Projector number."""
     coordinator: BenQProjectorCoordinator = config_entry.runtime_data
 
-    entity_descriptions = [
-        NumberEntityDescription(key="con", translation_key="con", native_max_value=100),
-        NumberEntityDescription(key="bri", translation_key="bri", native_max_value=100),
-        NumberEntityDescription(
-            key="color", translation_key="color", native_max_value=20
-        ),
-        NumberEntityDescription(
-            key="sharp", translation_key="sharp", native_max_value=20
-        ),
-        NumberEntityDescription(
-            key="micvol", translation_key="micvol", native_max_value=20
-        ),
-        NumberEntityDescription(
-            key="keyst",
-            translation_key="keyst",
-            native_max_value=20,
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        NumberEntityDescription(
-            key="hkeystone",
-            translation_key="hkeystone",
-            native_max_value=20,
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        NumberEntityDescription(
-            key="vkeystone",
-            translation_key="vkeystone",
-            native_max_value=20,
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        NumberEntityDescription(
-            key="rgain",
-            translation_key="rgain",
-            native_max_value=200,
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        NumberEntityDescription(
-            key="ggain",
-            translation_key="ggain",
-            native_max_value=200,
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        NumberEntityDescription(
-            key="bgain",
-            translation_key="bgain",
-            native_max_value=200,
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        NumberEntityDescription(
-            key="roffset",
-            translation_key="roffset",
-            native_max_value=511,
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        NumberEntityDescription(
-            key="goffset",
-            translation_key="goffset",
-            native_max_value=511,
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        NumberEntityDescription(
-            key="boffset",
-            translation_key="boffset",
-            native_max_value=511,
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        # NumberEntityDescription(key="gamma", translation_key="gamma", native_min_value=1.6, native_max_value=2.8, native_step=0.1, entity_category=EntityCategory.CONFIG, entity_registry_enabled_default=False,),
-        NumberEntityDescription(
-            key="hdrbri",
-            translation_key="hdrbri",
-            native_min_value=-2,
-            native_max_value=2,
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-    ]
-
     entities = []
 
-    for entity_description in entity_descriptions:
+    for entity_description in NUMBER_ENTITY_DESCRIPTIONS:
         if coordinator.supports_command(entity_description.key):
             entities.append(
                 BenQProjectorNumber(
@@ -122,11 +36,9 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class BenQProjectorNumber(CoordinatorEntity, NumberEntity):
+class BenQProjectorNumber(BenQProjectorEntity, NumberEntity):
     """Base BenQ Projector Number."""
 
-    _attr_has_entity_name = True
-    _attr_available = False
     _attr_native_min_value = 0
     _attr_native_step = 1
     _attr_native_value = None
@@ -145,10 +57,16 @@ class BenQProjectorNumber(CoordinatorEntity, NumberEntity):
 
         self.entity_description = entity_description
 
+        self._value_writer = BenQProjectorValueWriter(
+            self._async_write_value, self._async_create_write_task
+        )
+
     async def async_added_to_hass(self) -> None:
         """Called when number is added to Home Assistant."""
         await super().async_added_to_hass()
 
+        self.async_on_remove(self._value_writer.cancel)
+
         if self.coordinator.data and (
             native_value := self.coordinator.data.get(self.entity_description.key)
         ):
@@ -168,14 +86,6 @@ class BenQProjectorNumber(CoordinatorEntity, NumberEntity):
         else:
             _LOGGER.debug("%s is not available", self.entity_description.key)
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not self._attr_available:
-            return self._attr_available
-
-        return self.coordinator.last_update_success
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -203,37 +113,32 @@ class BenQProjectorNumber(CoordinatorEntity, NumberEntity):
         else:
             self._attr_available = False
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
     async def async_set_native_value(self, value: float) -> None:
         if self.coordinator.power_status == BenQProjector.POWERSTATUS_ON:
-            if self._attr_native_value == value:
+            if self._attr_native_value == value and not self._value_writer.busy:
                 return
 
-            while self._attr_native_value < value:
-                if (
-                    await self.coordinator.async_send_command(
-                        self.entity_description.key, "+"
-                    )
-                    == "+"
-                ):
-                    self._attr_native_value += self._attr_native_step
-                else:
-                    break
-
-            while self._attr_native_value > value:
-                if (
-                    await self.coordinator.async_send_command(
-                        self.entity_description.key, "-"
-                    )
-                    == "-"
-                ):
-                    self._attr_native_value -= self._attr_native_step
-                else:
-                    break
-
-            self.async_write_ha_state()
+            await self._value_writer.async_write(value)
         else:
             self._attr_available = False
 
         self.async_write_ha_state()
+
+    async def _async_write_value(self, value: float) -> None:
+        key = self.entity_description.key
+        if (accepted := await self.coordinator.async_set_value(key, value)) is True:
+            self._attr_native_value = value
+            return
+
+        # Step towards the latest target, which can change while stepping. If the absolute value
+        # may have been applied the current value is read first.
+        native_value = await self.coordinator.async_step_value(
+            key,
+            None if accepted is None else self._attr_native_value,
+            lambda: self._value_writer.target,
+            self._attr_native_step,
+        )
+        if native_value is not None:
+            self._attr_native_value = native_value
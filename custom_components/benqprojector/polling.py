@@ -0,0 +1,80 @@
+"""Adaptive polling planner for the BenQ Projector Home Assistant integration."""
+
+import time
+
+# Polling classes, the class of a key limits how far its polling can slow down.
+POLL_CLASS_FAST = "fast"
+POLL_CLASS_NORMAL = "normal"
+POLL_CLASS_SLOW = "slow"
+
+# The maximum number of polling intervals between two polls of a key per polling class.
+_MAX_INTERVALS = {
+    POLL_CLASS_FAST: 1,
+    POLL_CLASS_NORMAL: 4,
+    POLL_CLASS_SLOW: 60,
+}
+
+# Number of seconds all keys are polled every interval after a user interaction.
+BOOST_DURATION = 30
+
+
+class BenQProjectorPollingPlanner:
+    """
+    Decides which keys are due to be polled.
+
+    Every key starts with being polled every interval. Each time a key is polled without its
+    value having changed the number of intervals until its next poll doubles, up to the maximum
+    of its polling class. When the value of a key changes it is polled every interval again.
+    After a user interaction all keys are polled every interval for a short while.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+
+        self._poll_classes: dict[str, str] = {}
+        self._intervals: dict[str, int] = {}
+        self._next_poll: dict[str, float] = {}
+        self._boost_until = 0.0
+
+    def set_poll_class(self, key: str, poll_class: str) -> None:
+        """Set the polling class of a key."""
+        self._poll_classes[key] = poll_class
+
+    def poll_class(self, key: str) -> str:
+        """Return the polling class of a key."""
+        return self._poll_classes.get(key, POLL_CLASS_NORMAL)
+
+    def boost(self, duration: float = BOOST_DURATION) -> None:
+        """Poll all keys every interval for the given number of seconds."""
+        self._boost_until = max(self._boost_until, time.monotonic() + duration)
+
+    def reset(self) -> None:
+        """Make all keys due to be polled and poll them every interval again."""
+        self._intervals.clear()
+        self._next_poll.clear()
+
+    def is_due(self, key: str) -> bool:
+        """Return True if the key is due to be polled."""
+        now = time.monotonic()
+        if now < self._boost_until:
+            return True
+
+        return now >= self._next_poll.get(key, 0.0)
+
+    def record_poll(self, key: str, changed: bool) -> None:
+        """Record that a key has been polled and if its value changed."""
+        if changed:
+            intervals = 1
+        else:
+            intervals = min(
+                self._intervals.get(key, 1) * 2,
+                _MAX_INTERVALS[self.poll_class(key)],
+            )
+        self._intervals[key] = intervals
+
+        # Half an interval of slack, so a key is not skipped because a sweep started early
+        self._next_poll[key] = time.monotonic() + (intervals - 0.5) * self.interval
+
+    def next_poll_intervals(self) -> dict[str, int]:
+        """Return the current number of intervals between polls per key."""
+        return dict(self._intervals)
@@ -0,0 +1,249 @@
+"""Lightweight projector probes for the BenQ Projector config flow."""
+
+import asyncio
+import contextlib
+import importlib.resources
+import ipaddress
+import json
+import logging
+import re
+from dataclasses import dataclass
+
+import serial
+import serial_asyncio_fast as serial_asyncio
+from benqprojector import BAUD_RATES, BenQProjector
+from benqprojector.benqconnection import BenQConnection, BenQConnectionError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for a projector to answer a probe.
+PROBE_TIMEOUT = 0.75
+# Seconds to wait for a network connection, hosts that do not exist are not refused but time out.
+CONNECT_TIMEOUT = 1.0
+# The number of hosts that are probed at the same time when scanning a network.
+SCAN_CONCURRENCY = 64
+# The largest number of hosts a network scan probes, a /22 network.
+MAX_SCAN_HOSTS = 1024
+
+# A projector answers the power state query with its power state, or with a block item response
+# while it is powering on or off. Both only make it through at the right baud rate.
+_POWER_RESPONSE_RE = re.compile(rb"\*(pow=[a-z]+|block item)#", re.IGNORECASE)
+
+# The errors a projector can answer a query with, some models send them without the * and #.
+_ERROR_RESPONSES = rb"illegal format|unsupported item|block item"
+
+
+@dataclass(frozen=True)
+class BenQProjectorIdentity:
+    """What a probe learned about a projector."""
+
+    unique_id: str
+    power: str | None
+    model: str | None
+    mac: str | None
+    # Projectors with a serial interface show a command prompt, most networked projectors don't
+    has_prompt: bool
+
+
+async def _async_read_until(
+    reader: asyncio.StreamReader, pattern: re.Pattern, timeout: float
+) -> re.Match | None:
+    """Read from the stream until the pattern matches or the timeout expires."""
+    data = b""
+    try:
+        async with asyncio.timeout(timeout):
+            while not (match := pattern.search(data)):
+                if not (chunk := await reader.read(256)):
+                    return None
+                data += chunk
+    except TimeoutError:
+        return None
+    return match
+
+
+async def _async_query(
+    connection: BenQConnection, key: str
+) -> tuple[bytes | None, bytes]:
+    """
+    Query a key and return the value and all data read, or None if the query failed.
+
+    The connection read times out after a short while, reading continues until the projector
+    answered or the probe timeout expires. The query itself can be echoed, the ? in the echo
+    keeps it from being taken for the value.
+    """
+    pattern = re.compile(
+        rb"\*%s=([^#?\r\n]*)#|(%s)" % (re.escape(key.encode()), _ERROR_RESPONSES),
+        re.IGNORECASE,
+    )
+    await connection.write(f"\r*{key}=?#\r".encode())
+
+    data = b""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + PROBE_TIMEOUT
+    while not (match := pattern.search(data)):
+        if loop.time() > deadline:
+            return None, data
+        data += await connection.read(256)
+
+    return match.group(1), data
+
+
+def _read_supported_commands(model: str | None) -> list[str]:
+    """Return the commands the integration will use for the model, like the library does."""
+    configs = importlib.resources.files("benqprojector.configs")
+    model_filename = "".join(
+        c if c.isalnum() or c in "._-" else "_" for c in (model or "minimal").lower()
+    )
+    try:
+        config = json.loads(configs.joinpath(f"{model_filename}.json").read_text())
+    except FileNotFoundError:
+        config = {}
+
+    # Fall back to the generic config like the library does
+    if (commands := config.get("commands")) is None:
+        commands = json.loads(configs.joinpath("all.json").read_text())["commands"]
+    return commands
+
+
+async def async_identify_projector(
+    projector: BenQProjector,
+) -> BenQProjectorIdentity | None:
+    """
+    Read the power state, model and MAC address of a projector, or None if none answers.
+
+    Unlike connecting the projector this does not detect the prompt separately, does not load
+    the model configuration and does not read the power state twice.
+    """
+    connection = projector.connection
+    try:
+        if not await connection.open():
+            return None
+    except BenQConnectionError as ex:
+        _LOGGER.debug("Unable to open %s: %s", connection, ex)
+        return None
+
+    try:
+        power, data = await _async_query(connection, "pow")
+        if power is None and not re.search(_ERROR_RESPONSES, data, re.IGNORECASE):
+            _LOGGER.debug("No projector answered on %s", connection)
+            return None
+        has_prompt = b">" in data
+
+        model, _ = await _async_query(connection, "modelname")
+        model = model.decode() if model else None
+
+        mac = None
+        supported_commands = await asyncio.get_running_loop().run_in_executor(
+            None, _read_supported_commands, model
+        )
+        if "macaddr" in supported_commands:
+            mac, _ = await _async_query(connection, "macaddr")
+            mac = mac.decode().lower() if mac else None
+    except (BenQConnectionError, OSError) as ex:
+        _LOGGER.debug("Error probing %s: %s", connection, ex)
+        return None
+    finally:
+        await connection.close()
+
+    return BenQProjectorIdentity(
+        unique_id=mac or projector.unique_id,
+        power=power.decode().lower() if power else None,
+        model=model,
+        mac=mac,
+        has_prompt=has_prompt,
+    )
+
+
+async def _async_query_power(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> bool:
+    """Return True if the power state query is answered like a projector does."""
+    writer.write(b"\r*pow=?#\r")
+    await writer.drain()
+    return (
+        await _async_read_until(reader, _POWER_RESPONSE_RE, PROBE_TIMEOUT) is not None
+    )
+
+
+async def async_probe_serial_port(serial_port: str, baud_rate: int) -> bool:
+    """Return True if a projector answers a power state query at the given baud rate."""
+    try:
+        # Do not probe ports that are in use by another integration
+        reader, writer = await serial_asyncio.open_serial_connection(
+            url=serial_port, baudrate=baud_rate, exclusive=True
+        )
+    except (serial.SerialException, OSError) as ex:
+        _LOGGER.debug("Unable to open %s: %s", serial_port, ex)
+        return False
+
+    try:
+        return await _async_query_power(reader, writer)
+    except (serial.SerialException, OSError) as ex:
+        _LOGGER.debug("Error probing %s: %s", serial_port, ex)
+        return False
+    finally:
+        writer.close()
+        # The port is locked until it is closed, wait for it before probing the next baud rate
+        with contextlib.suppress(serial.SerialException, OSError):
+            await writer.wait_closed()
+
+
+async def async_detect_baud_rate(serial_port: str) -> int | None:
+    """Return the baud rate a projector on the serial port answers at, fastest first."""
+    for baud_rate in sorted(BAUD_RATES, reverse=True):
+        if await async_probe_serial_port(serial_port, baud_rate):
+            _LOGGER.debug("Projector found on %s at %s baud", serial_port, baud_rate)
+            return baud_rate
+    return None
+
+
+async def async_discover_serial_projectors(serial_ports: list[str]) -> dict[str, int]:
+    """Probe the serial ports concurrently and return the baud rate per projector found."""
+    baud_rates = await asyncio.gather(
+        *(async_detect_baud_rate(serial_port) for serial_port in serial_ports)
+    )
+    return {
+        serial_port: baud_rate
+        for serial_port, baud_rate in zip(serial_ports, baud_rates)
+        if baud_rate is not None
+    }
+
+
+async def async_probe_host(host: str, port: int) -> bool:
+    """Return True if a projector answers a power state query on the host and port."""
+    try:
+        async with asyncio.timeout(CONNECT_TIMEOUT):
+            reader, writer = await asyncio.open_connection(host, port)
+    except (TimeoutError, OSError):
+        return False
+
+    try:
+        return await _async_query_power(reader, writer)
+    except OSError as ex:
+        _LOGGER.debug("Error probing %s:%s: %s", host, port, ex)
+        return False
+    finally:
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+
+
+async def async_scan_network(
+    network: ipaddress.IPv4Network | ipaddress.IPv6Network,
+    port: int,
+    exclude: set[str] | None = None,
+) -> list[str]:
+    """Probe the hosts of the network concurrently and return the hosts a projector answers on."""
+    semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+    async def probe(host: str) -> bool:
+        async with semaphore:
+            return await async_probe_host(host, port)
+
+    hosts = [
+        host
+        for address in network.hosts()
+        if (host := str(address)) not in (exclude or ())
+    ]
+    found = await asyncio.gather(*(probe(host) for host in hosts))
+    return [host for host, projector in zip(hosts, found) if projector]
@@ -0,0 +1,43 @@
+"""Unsolicited projector messages for the BenQ Projector Home Assistant integration."""
+
+import re
+from typing import Any
+
+from benqprojector import BenQProjector
+
+# A status line like *pow=on# or *VOL=5#. Queries like *pow=?# and increments like *bri=+#
+# are echoes of commands, not status lines.
+_FRAME_RE = re.compile(rb"\*([a-z0-9]+)=(?![+-]#)([^#?*\r\n>]+)#", re.IGNORECASE)
+
+_POWER_STATES = {
+    "on": BenQProjector.POWERSTATUS_ON,
+    "off": BenQProjector.POWERSTATUS_OFF,
+}
+
+
+def parse_push_frames(data: bytes) -> dict[str, Any]:
+    """
+    Return the key values of the status lines in the data, the latest value per key.
+
+    The values are converted like the coordinator state, the power state to a power status and
+    the volume to a number.
+    """
+    values: dict[str, Any] = {}
+    for match in _FRAME_RE.finditer(data):
+        key = match.group(1).decode(errors="ignore").lower()
+        value = match.group(2).decode(errors="ignore").strip().lower()
+
+        if key == "pow":
+            if (power_status := _POWER_STATES.get(value)) is not None:
+                values[key] = power_status
+        elif key == "vol":
+            try:
+                values[key] = int(value)
+            except ValueError:
+                pass
+        elif key == "mute":
+            values[key] = value == "on"
+        else:
+            values[key] = value
+
+    return values
@@ -1,5 +1,6 @@
 """Creates Select entities for the BenQ Projector Home Assistant integration."""
 
+import dataclasses
 import logging
 import re
 
@@ -7,11 +8,11 @@ from benqprojector import BenQProjector
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BenQProjectorCoordinator
+from .descriptions import SELECT_ENTITY_DESCRIPTIONS
+from .entity import BenQProjectorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,59 +25,15 @@ async def async_setup_entry(
     """Set up the BenQ Serial Projector select."""
     coordinator: BenQProjectorCoordinator = config_entry.runtime_data
 
-    entity_descriptions = [
-        SelectEntityDescription(
-            key="audiosour",
-            translation_key="audiosour",
-            options=coordinator.projector.audio_sources,
-        ),
-        SelectEntityDescription(
-            key="appmod",
-            translation_key="appmod",
-            options=coordinator.projector.picture_modes,
-        ),
-        SelectEntityDescription(
-            key="ct",
-            translation_key="ct",
-            options=coordinator.projector.color_temperatures,
-            entity_category=EntityCategory.CONFIG,
-        ),
-        SelectEntityDescription(
-            key="asp",
-            translation_key="asp",
-            options=coordinator.projector.aspect_ratios,
-        ),
-        SelectEntityDescription(
-            key="lampm",
-            translation_key="lampm",
-            options=coordinator.projector.lamp_modes,
-            entity_category=EntityCategory.CONFIG,
-        ),
-        SelectEntityDescription(
-            key="3d",
-            translation_key="3d",
-            options=coordinator.projector.threed_modes,
-            entity_category=EntityCategory.CONFIG,
-        ),
-        # SelectEntityDescription(key="rr", None, translation_key="rr", entity_category=EntityCategory.CONFIG],
-        SelectEntityDescription(
-            key="pp",
-            translation_key="pp",
-            options=coordinator.projector.projector_positions,
-            entity_category=EntityCategory.CONFIG,
-        ),
-        SelectEntityDescription(
-            key="menuposition",
-            translation_key="menuposition",
-            options=coordinator.projector.menu_positions,
-            entity_category=EntityCategory.CONFIG,
-        ),
-    ]
-
     entities = []
 
-    for entity_description in entity_descriptions:
+    for entity_description in SELECT_ENTITY_DESCRIPTIONS:
         if coordinator.supports_command(entity_description.key):
+            # The options depend on the projector model
+            entity_description = dataclasses.replace(
+                entity_description,
+                options=coordinator.option_list(entity_description.option_list),
+            )
             entities.append(
                 BenQProjectorSelect(
                     coordinator, entity_description, config_entry.entry_id
@@ -86,12 +43,9 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class BenQProjectorSelect(CoordinatorEntity, SelectEntity):
+class BenQProjectorSelect(BenQProjectorEntity, SelectEntity):
     """Base BenQ Projector Select."""
 
-    _attr_has_entity_name = True
-    _attr_available = False
-
     def __init__(
         self,
         coordinator: BenQProjectorCoordinator,
@@ -126,14 +80,6 @@ class BenQProjectorSelect(CoordinatorEntity, SelectEntity):
 
         self.async_write_ha_state()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not self._attr_available:
-            return self._attr_available
-
-        return self.coordinator.last_update_success
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -150,7 +96,7 @@ class BenQProjectorSelect(CoordinatorEntity, SelectEntity):
         else:
             self._attr_available = False
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
     @property
     def options(self) -> list[str]:
@@ -1,6 +1,9 @@
 """Creates Sensor entities for the BenQ Projector Home Assistant integration."""
 
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 
 from benqprojector import BenQProjector
 from homeassistant.components.sensor import (
@@ -10,16 +13,79 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTime
+from homeassistant.const import PERCENTAGE, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_track_time_interval
 
 from . import BenQProjectorCoordinator
+from .entity import BenQProjectorEntity
+from .link_statistics import BenQProjectorLinkStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
+# Interval at which the link sensors are updated from the link statistics.
+LINK_SENSOR_INTERVAL = timedelta(seconds=10)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BenQProjectorLinkSensorEntityDescription(SensorEntityDescription):
+    """Describes a BenQ Projector link sensor."""
+
+    value_fn: Callable[[BenQProjectorLinkStatistics], float | datetime | None]
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    if seconds is None:
+        return None
+    return seconds * 1000
+
+
+LINK_SENSOR_DESCRIPTIONS = (
+    BenQProjectorLinkSensorEntityDescription(
+        key="link_latency",
+        translation_key="link_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda statistics: _milliseconds(statistics.last_latency),
+    ),
+    BenQProjectorLinkSensorEntityDescription(
+        key="link_latency_p95",
+        translation_key="link_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda statistics: _milliseconds(statistics.latency_percentile(95)),
+    ),
+    BenQProjectorLinkSensorEntityDescription(
+        key="link_commands_per_minute",
+        translation_key="link_commands_per_minute",
+        native_unit_of_measurement="commands/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda statistics: statistics.commands_per_minute,
+    ),
+    BenQProjectorLinkSensorEntityDescription(
+        key="link_error_rate",
+        translation_key="link_error_rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda statistics: (
+            None if statistics.error_rate is None else statistics.error_rate * 100
+        ),
+    ),
+    BenQProjectorLinkSensorEntityDescription(
+        key="link_connected_since",
+        translation_key="link_connected_since",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda statistics: statistics.connected_at,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -76,14 +142,19 @@ async def async_setup_entry(
                 )
             )
 
+    for entity_description in LINK_SENSOR_DESCRIPTIONS:
+        entities.append(
+            BenQProjectorLinkSensor(
+                coordinator, entity_description, config_entry.entry_id
+            )
+        )
+
     async_add_entities(entities)
 
 
-class BenQProjectorSensor(CoordinatorEntity, SensorEntity):
+class BenQProjectorSensor(BenQProjectorEntity, SensorEntity):
     """Base BenQ Projector Sensor."""
 
-    _attr_has_entity_name = True
-    _attr_available = False
     _attr_native_value = None
 
     def __init__(
@@ -115,14 +186,6 @@ class BenQProjectorSensor(CoordinatorEntity, SensorEntity):
 
         self.async_write_ha_state()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not self._attr_available:
-            return self._attr_available
-
-        return self.coordinator.last_update_success
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -139,7 +202,7 @@ class BenQProjectorSensor(CoordinatorEntity, SensorEntity):
         else:
             self._attr_available = False
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
 
 class BenQProjectorLampTimeSensor(BenQProjectorSensor):
@@ -162,4 +225,68 @@ class BenQProjectorLampTimeSensor(BenQProjectorSensor):
                 )
                 self._attr_available = False
 
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed()
+
+
+class BenQProjectorLinkSensor(BenQProjectorEntity, SensorEntity):
+    """
+    BenQ Projector Link Sensor.
+
+    Reports the health of the link to the projector from the statistics the coordinator
+    collects, the projector is not queried for these sensors.
+    """
+
+    entity_description: BenQProjectorLinkSensorEntityDescription
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    # The power state is not a diagnostic value, it is polled every sweep
+    _attr_poll_class = None
+
+    def __init__(
+        self,
+        coordinator: BenQProjectorCoordinator,
+        entity_description: BenQProjectorLinkSensorEntityDescription,
+        config_entry_id: str,
+    ) -> None:
+        """Initialize the sensor."""
+        # The statistics are refreshed on an interval, only a power change is followed right away
+        super().__init__(coordinator, "pow")
+
+        self._attr_device_info = coordinator.device_info
+        self._attr_unique_id = f"{config_entry_id}-{entity_description.key}"
+
+        self.entity_description = entity_description
+
+    @property
+    def available(self) -> bool:
+        """The link sensors are also available while the link is down."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Called when sensor is added to Home Assistant."""
+        await super().async_added_to_hass()
+
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_update_link, LINK_SENSOR_INTERVAL
+            )
+        )
+        self._update_from_statistics()
+        self.async_write_ha_state()
+
+    def _update_from_statistics(self) -> None:
+        self._attr_native_value = self.entity_description.value_fn(
+            self.coordinator.link_statistics
+        )
+
+    @callback
+    def _async_update_link(self, _now: datetime) -> None:
+        self._update_from_statistics()
+        self.async_write_ha_state_if_changed()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_statistics()
+        self.async_write_ha_state_if_changed()
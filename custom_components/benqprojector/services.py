@@ -0,0 +1,294 @@
+"""Services for the BenQ Projector Home Assistant integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from benqprojector import BenQProjector
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import CONF_DEVICE_ID, Platform
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from .command_queue import PRIORITY_SERVICE
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import BenQProjectorCoordinator
+
+CONF_SERVICE_COMMAND = "command"
+CONF_SERVICE_ACTION = "action"
+CONF_SERVICE_COMMANDS = "commands"
+CONF_SERVICE_STOP_ON_ERROR = "stop_on_error"
+CONF_SERVICE_SETTINGS = "settings"
+CONF_SERVICE_NAME = "name"
+CONF_SERVICE_PERSIST = "persist"
+
+DEFAULT_SNAPSHOT_NAME = "default"
+
+# Platforms of the entities whose keys are included in a snapshot, the settings that can be
+# applied.
+SNAPSHOT_PLATFORMS = (Platform.NUMBER, Platform.SELECT, Platform.SWITCH)
+
+SERVICE_SEND = "send"
+SERVICE_SEND_RAW = "send_raw"
+SERVICE_SEND_BATCH = "send_batch"
+SERVICE_APPLY_PRESET = "apply_preset"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+
+SERVICE_SEND_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Required(CONF_SERVICE_COMMAND): cv.string,
+        vol.Optional(CONF_SERVICE_ACTION): cv.string,
+    }
+)
+SERVICE_SEND_RAW_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Required(CONF_SERVICE_COMMAND): cv.string,
+    }
+)
+SERVICE_SEND_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Required(CONF_SERVICE_COMMANDS): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(CONF_SERVICE_COMMAND): cv.string,
+                        vol.Optional(CONF_SERVICE_ACTION, default="?"): cv.string,
+                    }
+                )
+            ],
+        ),
+        vol.Optional(CONF_SERVICE_STOP_ON_ERROR, default=False): cv.boolean,
+    }
+)
+SERVICE_APPLY_PRESET_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Required(CONF_SERVICE_SETTINGS): vol.Schema(
+            # Strings are kept as is, select options can look like numbers
+            {cv.string: vol.Any(str, bool, vol.Coerce(float))}
+        ),
+    }
+)
+SERVICE_SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Optional(CONF_SERVICE_NAME, default=DEFAULT_SNAPSHOT_NAME): cv.string,
+        vol.Optional(CONF_SERVICE_PERSIST, default=False): cv.boolean,
+    }
+)
+SERVICE_RESTORE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Optional(CONF_SERVICE_NAME, default=DEFAULT_SNAPSHOT_NAME): cv.string,
+    }
+)
+
+
+@callback
+def async_get_entry(hass: HomeAssistant, device_id: str) -> ConfigEntry:
+    """
+    Return the loaded config entry of the projector with the given device id.
+
+    Both the device registry and the config entries are indexed by id, so this does not depend
+    on the number of configured projectors.
+    """
+    if (device := dr.async_get(hass).async_get(device_id)) is None:
+        raise ServiceValidationError(f"Unknown BenQ projector device {device_id}")
+
+    for entry_id in device.config_entries:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if (
+            entry is not None
+            and entry.domain == DOMAIN
+            and entry.state is ConfigEntryState.LOADED
+        ):
+            return entry
+
+    raise ServiceValidationError(f"BenQ projector {device.name} is not loaded")
+
+
+@callback
+def async_get_coordinator(
+    hass: HomeAssistant, device_id: str
+) -> BenQProjectorCoordinator:
+    """Return the coordinator of the projector with the given device id."""
+    return async_get_entry(hass, device_id).runtime_data
+
+
+@callback
+def async_get_setting_keys(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, str]:
+    """Return the keys of the number, select and switch entities with their platform."""
+    prefix = f"{entry.entry_id}-"
+    return {
+        registry_entry.unique_id.removeprefix(prefix): registry_entry.domain
+        for registry_entry in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+        if registry_entry.domain in SNAPSHOT_PLATFORMS
+        and registry_entry.unique_id.startswith(prefix)
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """
+    Register the BenQ Projector services.
+
+    The services are registered once for all projectors, every call is routed to the projector
+    of the given device. Calls for different projectors run concurrently, each on the connection
+    of its own projector.
+    """
+
+    async def async_handle_send(call: ServiceCall):
+        """Handle the send service call."""
+        coordinator = async_get_coordinator(hass, call.data[CONF_DEVICE_ID])
+        command: str = call.data.get(CONF_SERVICE_COMMAND)
+        action: str = call.data.get(CONF_SERVICE_ACTION)
+
+        response = await coordinator.async_send_command(
+            command, action, False, PRIORITY_SERVICE
+        )
+
+        return {"response": response}
+
+    async def async_handle_send_raw(call: ServiceCall):
+        """Handle the send_raw service call."""
+        coordinator = async_get_coordinator(hass, call.data[CONF_DEVICE_ID])
+        command: str = call.data.get(CONF_SERVICE_COMMAND)
+
+        response = await coordinator.async_send_raw_command(command, PRIORITY_SERVICE)
+
+        return {"response": response}
+
+    async def async_handle_send_batch(call: ServiceCall):
+        """Handle the send_batch service call."""
+        coordinator = async_get_coordinator(hass, call.data[CONF_DEVICE_ID])
+        commands = [
+            (item[CONF_SERVICE_COMMAND], item[CONF_SERVICE_ACTION])
+            for item in call.data[CONF_SERVICE_COMMANDS]
+        ]
+
+        responses = await coordinator.async_send_batch(
+            commands, call.data[CONF_SERVICE_STOP_ON_ERROR], PRIORITY_SERVICE
+        )
+
+        return {
+            "responses": [
+                {
+                    CONF_SERVICE_COMMAND: command,
+                    CONF_SERVICE_ACTION: action,
+                    "response": response,
+                }
+                for (command, action), response in zip(commands, responses)
+            ],
+            "completed": len(responses) == len(commands),
+        }
+
+    async def async_handle_apply_preset(call: ServiceCall):
+        """Handle the apply_preset service call."""
+        coordinator = async_get_coordinator(hass, call.data[CONF_DEVICE_ID])
+        if coordinator.power_status != BenQProjector.POWERSTATUS_ON:
+            raise ServiceValidationError("The BenQ projector is not turned on")
+
+        return await coordinator.async_apply_settings(
+            call.data[CONF_SERVICE_SETTINGS], PRIORITY_SERVICE
+        )
+
+    async def async_handle_snapshot(call: ServiceCall):
+        """Handle the snapshot service call."""
+        entry = async_get_entry(hass, call.data[CONF_DEVICE_ID])
+        coordinator: BenQProjectorCoordinator = entry.runtime_data
+        if coordinator.power_status != BenQProjector.POWERSTATUS_ON:
+            raise ServiceValidationError("The BenQ projector is not turned on")
+
+        keys = async_get_setting_keys(hass, entry)
+        values = await coordinator.async_read_keys(
+            [key for key in keys if coordinator.supports_command(key)]
+        )
+
+        settings = {}
+        for key, value in values.items():
+            if keys[key] == Platform.NUMBER:
+                # Numbers are restored as numbers, so increments can be used if needed
+                try:
+                    value = float(value)
+                except ValueError:
+                    continue
+            settings[key] = value
+
+        await coordinator.snapshots.async_set(
+            call.data[CONF_SERVICE_NAME], settings, call.data[CONF_SERVICE_PERSIST]
+        )
+
+        return {CONF_SERVICE_SETTINGS: settings}
+
+    async def async_handle_restore(call: ServiceCall):
+        """Handle the restore service call."""
+        coordinator = async_get_coordinator(hass, call.data[CONF_DEVICE_ID])
+        if coordinator.power_status != BenQProjector.POWERSTATUS_ON:
+            raise ServiceValidationError("The BenQ projector is not turned on")
+
+        name = call.data[CONF_SERVICE_NAME]
+        if (settings := await coordinator.snapshots.async_get(name)) is None:
+            raise ServiceValidationError(f"Unknown snapshot {name}")
+
+        return await coordinator.async_apply_settings(settings, PRIORITY_SERVICE)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND,
+        async_handle_send,
+        schema=SERVICE_SEND_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_RAW,
+        async_handle_send_raw,
+        schema=SERVICE_SEND_RAW_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_BATCH,
+        async_handle_send_batch,
+        schema=SERVICE_SEND_BATCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PRESET,
+        async_handle_apply_preset,
+        schema=SERVICE_APPLY_PRESET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT,
+        async_handle_snapshot,
+        schema=SERVICE_SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE,
+        async_handle_restore,
+        schema=SERVICE_RESTORE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,67 @@
+"""Settings snapshots for the BenQ Projector Home Assistant integration."""
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+class BenQProjectorSnapshots:
+    """
+    Keeps named snapshots of the settings of a projector.
+
+    Snapshots are kept in memory and can optionally be persisted, persisted snapshots are
+    loaded on first use so they do not slow down the setup of the integration.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshots"
+        )
+        self._snapshots: dict[str, dict[str, Any]] = {}
+        self._persisted: set[str] = set()
+        self._loaded = False
+
+    async def _async_load(self) -> None:
+        if self._loaded:
+            return
+
+        if (data := await self._store.async_load()) is not None:
+            persisted = data.get("snapshots", {})
+            # Snapshots taken since startup take precedence over the persisted ones
+            self._snapshots = persisted | self._snapshots
+            self._persisted = set(persisted)
+        self._loaded = True
+
+    async def async_get(self, name: str) -> dict[str, Any] | None:
+        """Return the snapshot with the given name."""
+        await self._async_load()
+        return self._snapshots.get(name)
+
+    async def async_set(
+        self, name: str, settings: dict[str, Any], persist: bool = False
+    ) -> None:
+        """Store a snapshot, and write it to disk if persist is True."""
+        await self._async_load()
+        self._snapshots[name] = settings
+
+        if persist:
+            self._persisted.add(name)
+        elif name not in self._persisted:
+            return
+
+        _LOGGER.debug("Saving snapshot %s", name)
+        await self._store.async_save(
+            {"snapshots": {name: self._snapshots[name] for name in self._persisted}}
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the persisted snapshots from disk."""
+        await self._store.async_remove()
@@ -10,11 +10,11 @@ from homeassistant.components.switch import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BenQProjectorCoordinator
+from .descriptions import SWITCH_ENTITY_DESCRIPTIONS
+from .entity import BenQProjectorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,96 +27,9 @@ async def async_setup_entry(
     """Set up the BenQ Projector switch."""
     coordinator: BenQProjectorCoordinator = config_entry.runtime_data
 
-    entity_descriptions = [
-        SwitchEntityDescription(
-            key="bc",
-            translation_key="bc",
-        ),
-        SwitchEntityDescription(
-            key="qas",
-            translation_key="qas",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="directpower",
-            translation_key="directpower",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="autopower",
-            translation_key="autopower",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="standbynet",
-            translation_key="standbynet",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="standbymic",
-            translation_key="standbymic",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="standbymnt",
-            translation_key="standbymnt",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(key="blank", translation_key="blank"),
-        SwitchEntityDescription(key="freeze", translation_key="freeze"),
-        SwitchEntityDescription(
-            key="ins",
-            translation_key="ins",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="lpsaver",
-            translation_key="lpsaver",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="prjlogincode",
-            translation_key="prjlogincode",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="broadcasting",
-            translation_key="broadcasting",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="amxdd",
-            translation_key="amxdd",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="highaltitude",
-            translation_key="highaltitude",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-        SwitchEntityDescription(
-            key="led",
-            translation_key="led",
-            entity_category=EntityCategory.CONFIG,
-            entity_registry_enabled_default=False,
-        ),
-    ]
-
     entities = []
 
-    for entity_description in entity_descriptions:
+    for entity_description in SWITCH_ENTITY_DESCRIPTIONS:
         if coordinator.supports_command(entity_description.key):
             entities.append(
                 BenQProjectorSwitch(
@@ -127,12 +40,10 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class BenQProjectorSwitch(CoordinatorEntity, SwitchEntity):
+class BenQProjectorSwitch(BenQProjectorEntity, SwitchEntity):
     """Base BenQ Projector Switch."""
 
-    _attr_has_entity_name = True
     _attr_device_class = SwitchDeviceClass.SWITCH
-    _attr_available = False
     # _attr_should_poll = False
 
     _attr_is_on = None
@@ -166,14 +77,6 @@ class BenQProjectorSwitch(CoordinatorEntity, SwitchEntity):
 
         self.async_write_ha_state()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not self._attr_available:
-            return self._attr_available
-
-        return self.coordinator.last_update_success
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -194,7 +97,7 @@ class BenQProjectorSwitch(CoordinatorEntity, SwitchEntity):
         else:
             self._attr_available = False
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the entity on."""
@@ -0,0 +1,460 @@
+"""
+Simulates a BenQ projector for testing and benchmarking the BenQ Projector integration.
+
+The simulator speaks the <CR>*<key>=<value>#<CR> protocol over a pseudo terminal and/or a
+local TCP socket. The pseudo terminal can be used as the serial port of a serial config entry,
+the TCP socket as the host and port of a network config entry, or as socket://host:port serial
+port.
+
+Usage:
+    python tools/benqprojector_simulator.py --pty --tcp 8000 --model w1110
+
+The command set and option lists of a model are read from the configuration files of the
+benqprojector library when it is installed, or from a configuration file in the same format
+given with --config.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import time
+import tty
+from dataclasses import dataclass, field
+from importlib import resources
+from pathlib import Path
+from typing import Any
+
+_LOGGER = logging.getLogger("benqprojector_simulator")
+
+# The model that is simulated if no model is given, with the commands most projectors support.
+DEFAULT_CONFIG: dict[str, Any] = {
+    "commands": [
+        "3d",
+        "appmod",
+        "asp",
+        "bc",
+        "bgain",
+        "blank",
+        "boffset",
+        "bri",
+        "color",
+        "con",
+        "ct",
+        "directpower",
+        "freeze",
+        "ggain",
+        "goffset",
+        "lampm",
+        "ltim",
+        "macaddr",
+        "menu",
+        "menuposition",
+        "modelname",
+        "mute",
+        "pow",
+        "pp",
+        "qas",
+        "rgain",
+        "roffset",
+        "sharp",
+        "sour",
+        "vol",
+    ],
+    "video_sources": ["hdmi", "hdmi2", "rgb", "vid", "ypbr"],
+    "audio_sources": [],
+    "picture_modes": ["bright", "vivid", "cine", "game", "user1", "user2"],
+    "color_temperatures": ["warm", "normal", "cool", "native"],
+    "aspect_ratios": ["4:3", "16:9", "auto", "lbox", "wide"],
+    "projector_positions": ["ft", "re", "rc", "fc"],
+    "lamp_modes": ["lnor", "eco", "seco"],
+    "3d_modes": ["off", "auto", "tb", "fs", "fp", "sbs", "da", "iv"],
+    "menu_positions": ["cen", "tl", "tr", "br", "bl"],
+}
+
+# The option list per key that selects from a list of options.
+OPTION_LISTS = {
+    "sour": "video_sources",
+    "audiosour": "audio_sources",
+    "appmod": "picture_modes",
+    "ct": "color_temperatures",
+    "asp": "aspect_ratios",
+    "pp": "projector_positions",
+    "lampm": "lamp_modes",
+    "3d": "3d_modes",
+    "menuposition": "menu_positions",
+}
+
+# The range and initial value per numeric key.
+NUMBERS = {
+    "vol": (0, 20, 10),
+    "micvol": (0, 20, 10),
+    "con": (0, 100, 50),
+    "bri": (0, 100, 50),
+    "color": (0, 20, 10),
+    "sharp": (0, 20, 10),
+    "keyst": (0, 20, 10),
+    "hkeystone": (0, 20, 10),
+    "vkeystone": (0, 20, 10),
+    "rgain": (0, 200, 100),
+    "ggain": (0, 200, 100),
+    "bgain": (0, 200, 100),
+    "roffset": (0, 511, 256),
+    "goffset": (0, 511, 256),
+    "boffset": (0, 511, 256),
+    "hdrbri": (-2, 2, 0),
+    "tint": (0, 100, 50),
+}
+
+# Keys that report a value but can not be set.
+READ_ONLY = {"modelname", "macaddr", "ltim", "ltim2"}
+
+# Keys that can be read while the projector is off.
+POWER_OFF_KEYS = {"pow", "modelname", "macaddr", "ltim", "ltim2", "pp"}
+
+_background_tasks: set[asyncio.Task] = set()
+
+_COMMAND_RE = re.compile(r"^\*([a-z0-9]+)=([^#]*)#$", re.IGNORECASE)
+
+
+@dataclass
+class SimulatorOptions:
+    """Options of the simulated projector."""
+
+    model: str = "w1110"
+    config: dict[str, Any] = field(default_factory=lambda: dict(DEFAULT_CONFIG))
+    mac: str = "00:11:22:33:44:55"
+    # Serial projectors and serial to network bridges use a prompt, native network projectors
+    # do not
+    prompt: bool = True
+    echo: bool = True
+    # Bits per second of the simulated serial line, 0 for no pacing
+    baud_rate: int = 0
+    # Seconds the projector takes to power on and off
+    warm_up: float = 5.0
+    cool_down: float = 5.0
+    # Probability that a response is dropped or garbled
+    drop_rate: float = 0.0
+    garble_rate: float = 0.0
+    # Seconds the projector takes to process a command
+    processing_time: float = 0.0
+    absolute_values: bool = True
+    power: str = "off"
+
+
+class SimulatedProjector:
+    """The state of a simulated projector, shared by all of its connections."""
+
+    def __init__(self, options: SimulatorOptions) -> None:
+        self.options = options
+        self.commands = set(options.config["commands"]) | {"modelname"}
+        if options.mac:
+            self.commands.add("macaddr")
+
+        self.values: dict[str, str] = {
+            "modelname": options.model.upper(),
+            "macaddr": options.mac,
+            "ltim": "1234",
+            "ltim2": "567",
+            "mute": "off",
+        }
+        for key, option_list in OPTION_LISTS.items():
+            if options.config.get(option_list):
+                self.values[key] = options.config[option_list][0]
+        for key, (_, _, initial) in NUMBERS.items():
+            self.values[key] = str(initial)
+
+        self._power = options.power
+        self._power_changed = time.monotonic()
+
+    @property
+    def power(self) -> str:
+        """The power state, which settles after warming up or cooling down."""
+        elapsed = time.monotonic() - self._power_changed
+        if self._power == "warming" and elapsed >= self.options.warm_up:
+            self._power = "on"
+        elif self._power == "cooling" and elapsed >= self.options.cool_down:
+            self._power = "off"
+        return self._power
+
+    def _set_power(self, action: str) -> str:
+        if action == "on" and self.power == "off":
+            self._power = "warming"
+            self._power_changed = time.monotonic()
+        elif action == "off" and self.power == "on":
+            self._power = "cooling"
+            self._power_changed = time.monotonic()
+        elif self.power in ["warming", "cooling"]:
+            return "*Block item#"
+        return f"*POW={action.upper()}#"
+
+    def handle(self, line: str) -> str:
+        """Return the response to a command line."""
+        if not (match := _COMMAND_RE.match(line)):
+            return "*Illegal format#"
+
+        key = match.group(1).lower()
+        action = match.group(2).lower()
+
+        if key not in self.commands:
+            return "*Unsupported item#"
+
+        if key == "pow":
+            if action == "?":
+                power = self.power
+                return f"*POW={'ON' if power in ['on', 'warming'] else 'OFF'}#"
+            if action not in ["on", "off"]:
+                return "*Illegal format#"
+            return self._set_power(action)
+
+        if self.power != "on" and key not in POWER_OFF_KEYS:
+            return "*Block item#"
+
+        if action == "?":
+            if key not in self.values:
+                self.values[key] = "off"
+            return f"*{key.upper()}={self.values[key].upper()}#"
+
+        if key in READ_ONLY:
+            return "*Block item#"
+
+        if key in NUMBERS:
+            minimum, maximum, _ = NUMBERS[key]
+            value = int(self.values[key])
+            if action in ["+", "-"]:
+                value += 1 if action == "+" else -1
+            elif self.options.absolute_values and re.match(r"^-?\d+$", action):
+                value = int(action)
+            else:
+                return "*Illegal format#"
+            self.values[key] = str(max(minimum, min(maximum, value)))
+            if key == "vol":
+                self.values["mute"] = "off"
+            return f"*{key.upper()}={action.upper()}#"
+
+        if key in OPTION_LISTS:
+            if action not in self.options.config.get(OPTION_LISTS[key], []):
+                return "*Illegal format#"
+        elif key == "menu":
+            if action not in ["on", "off", "up", "down", "left", "right", "enter"]:
+                return "*Illegal format#"
+        elif action not in ["on", "off"]:
+            return "*Illegal format#"
+
+        self.values[key] = action
+        return f"*{key.upper()}={action.upper()}#"
+
+
+class SimulatorSession:
+    """Handles the command stream of a single connection to a simulated projector."""
+
+    def __init__(self, projector: SimulatedProjector, write) -> None:
+        self.projector = projector
+        self.options = projector.options
+        self._write = write
+        self._buffer = b""
+
+    async def _send(self, data: bytes) -> None:
+        if self.options.baud_rate:
+            # 8 data bits, a start and a stop bit per byte
+            await asyncio.sleep(len(data) * 10 / self.options.baud_rate)
+        await self._write(data)
+
+    async def feed(self, data: bytes) -> None:
+        """Handle the data received from the connection."""
+        self._buffer += data
+        while b"\r" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\r", 1)
+            await self._handle_line(line.strip(b"\n\x00 ").decode(errors="ignore"))
+
+    async def _handle_line(self, line: str) -> None:
+        if not line:
+            if self.options.prompt:
+                await self._send(b">")
+            return
+
+        if self.options.processing_time:
+            await asyncio.sleep(self.options.processing_time)
+
+        response = self.projector.handle(line)
+        _LOGGER.debug("%s -> %s", line, response)
+
+        if random.random() < self.options.drop_rate:
+            _LOGGER.debug("Dropping response")
+            return
+        if random.random() < self.options.garble_rate:
+            _LOGGER.debug("Garbling response")
+            response = "".join(random.sample(response, len(response)))
+
+        data = b""
+        if self.options.echo:
+            data += f"{line}\r\n".encode()
+        data += f"{response}\r\n".encode()
+        if self.options.prompt:
+            data += b">"
+        await self._send(data)
+
+
+async def serve_tcp(
+    projector: SimulatedProjector, host: str, port: int
+) -> asyncio.Server:
+    """Serve the simulated projector on a TCP socket."""
+
+    async def handle_connection(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        async def write(data: bytes) -> None:
+            writer.write(data)
+            await writer.drain()
+
+        session = SimulatorSession(projector, write)
+        _LOGGER.info("Connection from %s", writer.get_extra_info("peername"))
+        try:
+            while data := await reader.read(1024):
+                await session.feed(data)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle_connection, host, port)
+    _LOGGER.info("Listening on %s:%s", host, port)
+    return server
+
+
+async def serve_pty(projector: SimulatedProjector, link: str | None = None) -> str:
+    """Serve the simulated projector on a pseudo terminal and return its device path."""
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    os.set_blocking(master, False)
+    path = os.ttyname(slave)
+
+    if link:
+        if os.path.lexists(link):
+            os.remove(link)
+        os.symlink(path, link)
+        path = link
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[bytes] = asyncio.Queue()
+
+    def read() -> None:
+        try:
+            queue.put_nowait(os.read(master, 1024))
+        except BlockingIOError:
+            pass
+
+    async def write(data: bytes) -> None:
+        os.write(master, data)
+
+    async def handle() -> None:
+        session = SimulatorSession(projector, write)
+        while True:
+            await session.feed(await queue.get())
+
+    loop.add_reader(master, read)
+    # The slave is kept open so the pseudo terminal survives reconnects
+    task = asyncio.create_task(handle())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+    _LOGGER.info("Serial port %s", path)
+    return path
+
+
+def load_config(model: str, config_file: str | None) -> dict[str, Any]:
+    """Return the command set and option lists of a model."""
+    if config_file:
+        return json.loads(Path(config_file).read_text(encoding="utf-8"))
+
+    try:
+        config = resources.files("benqprojector").joinpath("configs", f"{model}.json")
+        return json.loads(config.read_text(encoding="utf-8"))
+    except (ModuleNotFoundError, FileNotFoundError):
+        _LOGGER.info("No configuration for model %s, using the default commands", model)
+        return dict(DEFAULT_CONFIG)
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--model", default="w1110", help="the model to simulate")
+    parser.add_argument("--config", help="a configuration file with the command set")
+    parser.add_argument("--mac", default="00:11:22:33:44:55", help="the MAC address")
+    parser.add_argument("--pty", action="store_true", help="serve on a pseudo terminal")
+    parser.add_argument("--link", help="symlink to the pseudo terminal")
+    parser.add_argument("--tcp", type=int, metavar="PORT", help="serve on a TCP port")
+    parser.add_argument("--host", default="127.0.0.1", help="the TCP host to bind to")
+    parser.add_argument(
+        "--no-prompt",
+        action="store_true",
+        help="do not use a prompt, like native network projectors",
+    )
+    parser.add_argument("--no-echo", action="store_true", help="do not echo commands")
+    parser.add_argument(
+        "--baud", type=int, default=0, help="pace the responses at this baud rate"
+    )
+    parser.add_argument("--warm-up", type=float, default=5.0, help="seconds")
+    parser.add_argument("--cool-down", type=float, default=5.0, help="seconds")
+    parser.add_argument("--processing-time", type=float, default=0.0, help="seconds")
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--garble-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--no-absolute-values",
+        action="store_true",
+        help="only accept increments for numeric keys",
+    )
+    parser.add_argument("--power", choices=["on", "off"], default="off")
+    parser.add_argument("--debug", action="store_true")
+    return parser.parse_args(argv)
+
+
+def options_from_arguments(args: argparse.Namespace) -> SimulatorOptions:
+    """Return the simulator options of the command line arguments."""
+    return SimulatorOptions(
+        model=args.model,
+        config=load_config(args.model, args.config),
+        mac=args.mac,
+        prompt=not args.no_prompt,
+        echo=not args.no_echo,
+        baud_rate=args.baud,
+        warm_up=args.warm_up,
+        cool_down=args.cool_down,
+        drop_rate=args.drop_rate,
+        garble_rate=args.garble_rate,
+        processing_time=args.processing_time,
+        absolute_values=not args.no_absolute_values,
+        power=args.power,
+    )
+
+
+async def main(argv: list[str] | None = None) -> None:
+    """Run the simulator until interrupted."""
+    args = parse_arguments(argv)
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+
+    if not args.pty and args.tcp is None:
+        args.pty = True
+
+    projector = SimulatedProjector(options_from_arguments(args))
+
+    if args.pty:
+        print(await serve_pty(projector, args.link), flush=True)
+    if args.tcp is not None:
+        server = await serve_tcp(projector, args.host, args.tcp)
+        print(f"socket://{args.host}:{args.tcp}", flush=True)
+        await server.start_serving()
+
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass